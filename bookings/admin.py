@@ -1,11 +1,36 @@
 from django.contrib import admin
+from django.db.models import QuerySet
+from django.http import HttpRequest
 from .models import Booking
 
 
 @admin.register(Booking)
 class BookingAdmin(admin.ModelAdmin):
-    list_display = ('user', 'room', 'date', 'start_time', 'end_time', 'created_at')
-    list_filter = ('date', 'room', 'user')
+    list_display = ('user_username', 'room_name', 'date', 'start_time', 'end_time', 'created_at')
+    list_filter = (
+        'date',
+        ('room', admin.RelatedOnlyFieldListFilter),
+        ('user', admin.RelatedOnlyFieldListFilter),
+    )
+    list_select_related = ('user', 'room')
+    raw_id_fields = ('user', 'room')
     search_fields = ('user__username', 'room__name', 'date')
     ordering = ('date', 'start_time')
     date_hierarchy = 'date'
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        """
+        Join users and rooms and load only the columns the admin uses.
+        """
+        return super().get_queryset(request).select_related('user', 'room').only(
+            'id', 'user', 'room', 'date', 'start_time', 'end_time',
+            'created_at', 'updated_at', 'user__username', 'room__name'
+        )
+
+    @admin.display(description='User', ordering='user__username')
+    def user_username(self, obj: Booking) -> str:
+        return obj.user.username
+
+    @admin.display(description='Room', ordering='room__name')
+    def room_name(self, obj: Booking) -> str:
+        return obj.room.name
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-14 10:47
+
+import bookings.models
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.operations
+import django.db.models.expressions
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('bookings', '0002_remove_booking_unique_room_booking_timeslot'),
+        ('rooms', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        django.contrib.postgres.operations.BtreeGistExtension(),
+        migrations.AddField(
+            model_name='booking',
+            name='time_range',
+            field=models.GeneratedField(db_persist=True, expression=bookings.models.TsRange(models.ExpressionWrapper(django.db.models.expressions.CombinedExpression(models.F('date'), '+', models.F('start_time')), output_field=models.DateTimeField()), models.ExpressionWrapper(django.db.models.expressions.CombinedExpression(models.F('date'), '+', models.F('end_time')), output_field=models.DateTimeField()), django.contrib.postgres.fields.ranges.RangeBoundary()), output_field=bookings.models.TimestampRangeField()),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[('room', '='), ('time_range', '&&')], name='booking_no_room_overlap', violation_error_message='This room is already booked during the requested time slot.'),
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(expressions=[('user', '='), ('time_range', '&&')], name='booking_no_user_overlap', violation_error_message='You already have another booking during this time slot.'),
+        ),
+    ]
@@ -1,13 +1,94 @@
 from django.db import models
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres import forms as postgres_forms
+from django.contrib.postgres.fields import RangeBoundary, RangeOperators
+from django.contrib.postgres.fields.ranges import ContinuousRangeField
 from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator
+from django.db.backends.postgresql.psycopg_any import DateTimeRange
 from django.utils import timezone
 from datetime import datetime, time
-from typing import Optional, Any, Dict
+from typing import Optional, Any, Dict, Iterable, List, Tuple
 
 User = get_user_model()
 
+ROOM_OVERLAP_MESSAGE = 'This room is already booked during the requested time slot.'
+USER_OVERLAP_MESSAGE = 'You already have another booking during this time slot.'
+
+
+class TimestampRangeField(ContinuousRangeField):
+    """
+    Range of naive timestamps (Postgres ``tsrange``).
+
+    Bookings are stored as a local date plus wall-clock times, so their
+    ranges carry no time zone, unlike ``DateTimeRangeField`` (``tstzrange``).
+    """
+    base_field = models.DateTimeField
+    range_type = DateTimeRange
+    form_field = postgres_forms.DateTimeRangeField
+
+    def db_type(self, connection: Any) -> str:
+        return 'tsrange'
+
+
+class TsRange(models.Func):
+    """
+    Postgres ``tsrange`` constructor, half-open (``[)``) unless told otherwise.
+    """
+    function = 'TSRANGE'
+    output_field = TimestampRangeField()
+
+
+def booking_time_range(date: Any = None, start_time: Any = None, end_time: Any = None) -> TsRange:
+    """
+    Return the ``[date + start_time, date + end_time)`` range of a booking.
+
+    Built from the booking's own columns unless other expressions are
+    given, e.g. ``Value``s for a slot being checked against stored ones.
+    """
+    date = date or models.F('date')
+    return TsRange(
+        models.ExpressionWrapper(
+            date + (start_time or models.F('start_time')),
+            output_field=models.DateTimeField()
+        ),
+        models.ExpressionWrapper(
+            date + (end_time or models.F('end_time')),
+            output_field=models.DateTimeField()
+        ),
+        RangeBoundary(),
+    )
+
+
+class BookingQuerySet(models.QuerySet):
+    """
+    QuerySet for bookings, centralizing the overlap predicate.
+    """
+
+    def overlapping(self, date: Any, start_time: time, end_time: time,
+                    exclude_pk: Optional[int] = None) -> 'BookingQuerySet':
+        """
+        Return bookings on ``date`` overlapping ``[start_time, end_time)``.
+
+        The optional exclusion is folded into the same ``filter()`` call so
+        the queryset is only cloned once. The room is joined for callers
+        that iterate the clashes; EXISTS probes and aggregates drop the join.
+        """
+        # Typed values keep the right-hand side a tsrange under both client-
+        # and server-side parameter binding
+        condition = models.Q(
+            date=date,
+            time_range__overlap=booking_time_range(
+                models.Value(date, output_field=models.DateField()),
+                models.Value(start_time, output_field=models.TimeField()),
+                models.Value(end_time, output_field=models.TimeField())
+            )
+        )
+        if exclude_pk:
+            condition &= ~models.Q(pk=exclude_pk)
+        return self.filter(condition).select_related('room')
+
 
 class Booking(models.Model):
     """
@@ -26,9 +107,16 @@ class Booking(models.Model):
     date = models.DateField()
     start_time = models.TimeField()
     end_time = models.TimeField()
+    time_range = models.GeneratedField(
+        expression=booking_time_range(),
+        output_field=TimestampRangeField(),
+        db_persist=True
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BookingQuerySet.as_manager()
+
     class Meta:
         ordering = ['date', 'start_time']
         verbose_name = 'Booking'
@@ -38,10 +126,39 @@ class Booking(models.Model):
                 check=models.Q(end_time__gt=models.F('start_time')),
                 name='end_time_after_start_time'
             ),
+            # Enforced by Postgres on every write, so concurrent requests
+            # cannot both pass the overlap checks and double-book. The GiST
+            # indexes backing these also serve ``time_range__overlap`` probes.
+            ExclusionConstraint(
+                name='booking_no_room_overlap',
+                expressions=[
+                    ('room', RangeOperators.EQUAL),
+                    ('time_range', RangeOperators.OVERLAPS),
+                ],
+                violation_error_message=ROOM_OVERLAP_MESSAGE
+            ),
+            ExclusionConstraint(
+                name='booking_no_user_overlap',
+                expressions=[
+                    ('user', RangeOperators.EQUAL),
+                    ('time_range', RangeOperators.OVERLAPS),
+                ],
+                violation_error_message=USER_OVERLAP_MESSAGE
+            ),
         ]
         indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['room', 'date']),
+            # Cover every overlap predicate so availability probes can be
+            # answered by an index-only scan.
+            models.Index(
+                fields=['room', 'date', 'start_time', 'end_time'],
+                include=['id'],
+                name='bk_room_date_st_et'
+            ),
+            models.Index(
+                fields=['user', 'date', 'start_time', 'end_time'],
+                include=['id'],
+                name='bk_user_date_st_et'
+            ),
             models.Index(fields=['date']),
         ]
 
@@ -57,7 +174,7 @@ class Booking(models.Model):
         4. User must not have other bookings that overlap with this one
         """
         # Check if date is in the past
-        if self.date < timezone.now().date():
+        if self.date < timezone.localdate():
             raise ValidationError({
                 'date': 'Booking date cannot be in the past.'
             })
@@ -68,59 +185,69 @@ class Booking(models.Model):
                 'end_time': 'End time must be after start time.'
             })
 
-        # Check room availability
-        self._validate_room_availability()
-        
-        # Check user's other bookings
-        self._validate_user_availability()
-
-    def _validate_room_availability(self) -> None:
-        """Check if the room is available during the requested time slot."""
-        # Skip validation if this is an existing booking being updated
-        if self.pk:
-            overlapping_bookings = Booking.objects.filter(
-                room=self.room,
-                date=self.date,
-                start_time__lt=self.end_time,
-                end_time__gt=self.start_time
-            ).exclude(pk=self.pk)
-        else:
-            overlapping_bookings = Booking.objects.filter(
-                room=self.room,
-                date=self.date,
-                start_time__lt=self.end_time,
-                end_time__gt=self.start_time
-            )
+        # Check room and user availability
+        self.validate_overlap()
 
-        if overlapping_bookings.exists():
+    def get_constraints(self) -> List[Tuple[Any, List[Any]]]:
+        """
+        Return the constraints ``full_clean()`` validates.
+
+        The overlap exclusion constraints are left out: ``clean()`` already
+        checks both in one query, so validating them again would report
+        each clash twice and cost two more queries.
+        """
+        return [
+            (model_class, [c for c in constraints if not isinstance(c, ExclusionConstraint)])
+            for model_class, constraints in super().get_constraints()
+        ]
+
+    @classmethod
+    def bulk_safe_create(cls, bookings: Iterable['Booking'], batch_size: int = 500) -> List['Booking']:
+        """
+        Insert many bookings in as few statements as possible.
+
+        No validation queries are run: bookings that overlap an existing one,
+        or each other, are skipped by the exclusion constraints instead of
+        failing the batch. Postgres does not report which rows were skipped,
+        so the returned objects have no primary key set.
+        """
+        return cls.objects.bulk_create(bookings, batch_size=batch_size, ignore_conflicts=True)
+
+    def validate_overlap(self) -> None:
+        """
+        Check that neither the room nor the user has another booking
+        overlapping the requested time slot, using a single query.
+        """
+        # Skip validation against itself if this is an existing booking being updated
+        overlapping_bookings = Booking.objects.overlapping(
+            self.date, self.start_time, self.end_time, exclude_pk=self.pk
+        )
+
+        # Count both kinds of clash in one roundtrip over the union of candidates
+        availability = overlapping_bookings.filter(
+            models.Q(room_id=self.room_id) | models.Q(user_id=self.user_id)
+        ).aggregate(
+            room_busy=models.Count('pk', filter=models.Q(room_id=self.room_id)),
+            user_busy=models.Count('pk', filter=models.Q(user_id=self.user_id))
+        )
+
+        # A room clash takes precedence over a clash with the user's other bookings
+        if availability.get('room_busy'):
             raise ValidationError({
-                'non_field_errors': 'This room is already booked during the requested time slot.'
+                'non_field_errors': ROOM_OVERLAP_MESSAGE
             })
 
-    def _validate_user_availability(self) -> None:
-        """Check if the user has other bookings that overlap with this one."""
-        # Skip validation if this is an existing booking being updated
-        if self.pk:
-            overlapping_bookings = Booking.objects.filter(
-                user=self.user,
-                date=self.date,
-                start_time__lt=self.end_time,
-                end_time__gt=self.start_time
-            ).exclude(pk=self.pk)
-        else:
-            overlapping_bookings = Booking.objects.filter(
-                user=self.user,
-                date=self.date,
-                start_time__lt=self.end_time,
-                end_time__gt=self.start_time
-            )
-
-        if overlapping_bookings.exists():
+        if availability.get('user_busy'):
             raise ValidationError({
-                'non_field_errors': 'You already have another booking during this time slot.'
+                'non_field_errors': USER_OVERLAP_MESSAGE
             })
             
     def save(self, *args: Any, **kwargs: Dict[str, Any]) -> None:
-        """Override save method to perform validation."""
-        self.clean()
+        """
+        Save the booking.
+
+        Overlaps are rejected by the database exclusion constraints, so no
+        validation queries are issued here; call ``full_clean()`` first for
+        friendly validation errors.
+        """
         super().save(*args, **kwargs)
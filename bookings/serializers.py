@@ -1,26 +1,173 @@
+from bisect import bisect_left, insort
+from collections import defaultdict
 from rest_framework import serializers
 from django.utils import timezone
-from django.db import transaction
-from .models import Booking
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Manager, Q, QuerySet, prefetch_related_objects
+from .models import Booking, ROOM_OVERLAP_MESSAGE, USER_OVERLAP_MESSAGE
 from rooms.models import Room
 from rooms.serializers import RoomSerializer
 from django.contrib.auth import get_user_model
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class RenderOncePerContextMixin:
+    """
+    Render each related instance once per serializer context.
+    
+    Bookings in a list typically share a handful of rooms and users; the
+    nested dict rendered for the first booking is copied for the rest.
+    """
+    render_cache_key: str = ''
+    
+    def to_representation(self, instance: Any) -> Dict[str, Any]:
+        cache = self.context.setdefault(self.render_cache_key, {})
+        if instance.pk not in cache:
+            cache[instance.pk] = super().to_representation(instance)
+        # A copy, so editing one booking's nested dict leaves the others alone
+        return dict(cache[instance.pk])
+
+
+class UserSerializer(RenderOncePerContextMixin, serializers.ModelSerializer):
     """
     Serializer for User objects in the context of bookings.
     """
+    render_cache_key = '_rendered_users'
+    
     class Meta:
         model = User
-        fields = ['id', 'username', 'email', 'first_name', 'last_name']
+        fields = ('id', 'username', 'email', 'first_name', 'last_name')
         read_only_fields = fields
         ref_name = "BookingUserSerializer"
 
 
+class BookingRoomSerializer(RenderOncePerContextMixin, RoomSerializer):
+    """
+    Serializer for Room objects nested in bookings.
+    """
+    render_cache_key = '_rendered_rooms'
+
+
+class BookedSlots:
+    """
+    In-memory index of booked time slots, keyed by (room, date) and (user, date).
+    
+    Slots under one key never overlap each other, so keeping them sorted by
+    start time means a new slot only has to be compared with the booking
+    that starts immediately before its end.
+    """
+    
+    def __init__(self) -> None:
+        self._slots: Dict[Tuple[str, Any, Any], List[Tuple[Any, Any]]] = defaultdict(list)
+        
+    def add(self, room_id: Any, user_id: Any, date: Any, start_time: Any, end_time: Any) -> None:
+        """Record a booked slot for both its room and its user."""
+        insort(self._slots[('room', room_id, date)], (start_time, end_time))
+        insort(self._slots[('user', user_id, date)], (start_time, end_time))
+        
+    def is_room_busy(self, room_id: Any, date: Any, start_time: Any, end_time: Any) -> bool:
+        """Return True if the room has a slot overlapping the given one."""
+        return self._overlaps(self._slots.get(('room', room_id, date), []), start_time, end_time)
+        
+    def is_user_busy(self, user_id: Any, date: Any, start_time: Any, end_time: Any) -> bool:
+        """Return True if the user has a slot overlapping the given one."""
+        return self._overlaps(self._slots.get(('user', user_id, date), []), start_time, end_time)
+        
+    @staticmethod
+    def _overlaps(slots: List[Tuple[Any, Any]], start_time: Any, end_time: Any) -> bool:
+        # Last slot starting before end_time is the only possible overlap
+        index = bisect_left(slots, (end_time,)) - 1
+        return index >= 0 and slots[index][1] > start_time
+
+
+class BookingListSerializer(serializers.ListSerializer):
+    """
+    Serializer for lists of bookings.
+    
+    When creating several bookings in one request, overlaps are checked
+    against a single preload of the affected rooms' and user's bookings
+    instead of one query per item, and between the items themselves.
+    """
+    # Every item is validated and saved in one transaction, so cap the batch
+    max_batch_size = 50
+    
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault('max_length', self.max_batch_size)
+        super().__init__(*args, **kwargs)
+    
+    def to_representation(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Batch-load the nested user and room before rendering each booking.
+        
+        Args:
+            data: Bookings to render
+            
+        Returns:
+            List[Dict[str, Any]]: Rendered bookings
+        """
+        bookings = list(data.all() if isinstance(data, Manager) else data)
+        
+        # Relations already joined by the caller are skipped
+        prefetch_related_objects(bookings, 'user', 'room')
+        return super().to_representation(bookings)
+    
+    def to_internal_value(self, data: Any) -> List[Dict[str, Any]]:
+        """
+        Validate every item, then check them all for overlaps at once.
+        
+        Args:
+            data: List of booking payloads
+            
+        Returns:
+            List[Dict[str, Any]]: Validated data
+        """
+        validated_items = super().to_internal_value(data)
+        user = self.context['request'].user
+        
+        # Preload existing bookings that could clash with any item
+        slots = BookedSlots()
+        existing_bookings = Booking.objects.filter(
+            Q(room__in={item['room'] for item in validated_items}) | Q(user=user),
+            date__in={item['date'] for item in validated_items}
+        ).order_by().values_list('room_id', 'user_id', 'date', 'start_time', 'end_time')
+        for booked in existing_bookings:
+            slots.add(*booked)
+        
+        errors = []
+        for item in validated_items:
+            slot = (item['date'], item['start_time'], item['end_time'])
+            if slots.is_room_busy(item['room'].pk, *slot):
+                errors.append({'non_field_errors': [ROOM_OVERLAP_MESSAGE]})
+            elif slots.is_user_busy(user.pk, *slot):
+                errors.append({'non_field_errors': [USER_OVERLAP_MESSAGE]})
+            else:
+                errors.append({})
+                # Later items in the same request must not clash with this one
+                slots.add(item['room'].pk, user.pk, *slot)
+        
+        if any(errors):
+            raise serializers.ValidationError(errors)
+        
+        return validated_items
+        
+    def create(self, validated_data: List[Dict[str, Any]]) -> List[Booking]:
+        """
+        Create all bookings, or none of them if any fails.
+        
+        Args:
+            validated_data: Validated data
+            
+        Returns:
+            List[Booking]: Created bookings
+        """
+        with transaction.atomic():
+            return super().create(validated_data)
+
+
 class BookingSerializer(serializers.ModelSerializer):
     """
     Serializer for Booking objects.
@@ -31,15 +178,29 @@ class BookingSerializer(serializers.ModelSerializer):
         source='room',
         write_only=True
     )
-    room = RoomSerializer(read_only=True)
+    room = BookingRoomSerializer(read_only=True)
     
     class Meta:
         model = Booking
-        fields = [
+        fields = (
             'id', 'user', 'room', 'room_id', 'date', 
             'start_time', 'end_time', 'created_at', 'updated_at'
-        ]
-        read_only_fields = ['id', 'user', 'created_at', 'updated_at']
+        )
+        read_only_fields = ('id', 'user', 'created_at', 'updated_at')
+        list_serializer_class = BookingListSerializer
+    
+    @classmethod
+    def prefetch_queryset(cls, queryset: QuerySet) -> QuerySet:
+        """
+        Join the relations rendered by the nested user and room fields.
+        
+        Args:
+            queryset: Booking queryset to optimize
+            
+        Returns:
+            QuerySet: Queryset with the nested relations joined
+        """
+        return queryset.select_related('user', 'room')
     
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -51,96 +212,48 @@ class BookingSerializer(serializers.ModelSerializer):
         Returns:
             Dict[str, Any]: Validated data
         """
-        # Check if date is in the past
-        if data.get('date') and data['date'] < timezone.now().date():
-            raise serializers.ValidationError({'date': 'Booking date cannot be in the past.'})
-        
-        # Check if end time is after start time
-        if data.get('start_time') and data.get('end_time') and data['end_time'] <= data['start_time']:
-            raise serializers.ValidationError({'end_time': 'End time must be after start time.'})
-        
-        # Check room availability
         room = data.get('room')
         date = data.get('date')
         start_time = data.get('start_time')
         end_time = data.get('end_time')
         
-        if all([room, date, start_time, end_time]):
-            # For existing booking, exclude the current instance
-            instance = self.instance
-            
-            # Check if room is available
-            if not self._is_room_available(room, date, start_time, end_time, instance):
-                raise serializers.ValidationError({
-                    'non_field_errors': 'This room is already booked during the requested time slot.'
-                })
-                
-            # Check if user has other bookings during this time
-            user = self.context['request'].user
-            if not self._is_user_available(user, date, start_time, end_time, instance):
-                raise serializers.ValidationError({
-                    'non_field_errors': 'You already have another booking during this time slot.'
-                })
+        # Resolve today once per request, shared by every item validated with this context
+        today = self.context.get('_today') or timezone.localdate()
+        self.context['_today'] = today
         
-        return data
-    
-    def _is_room_available(self, room: Room, date: Any, start_time: Any, 
-                          end_time: Any, instance: Booking = None) -> bool:
-        """
-        Check if the room is available during the requested time slot.
+        # Check if date is in the past
+        if date is not None and date < today:
+            raise serializers.ValidationError({'date': 'Booking date cannot be in the past.'})
         
-        Args:
-            room: Room object
-            date: Booking date
-            start_time: Start time
-            end_time: End time
-            instance: Current booking instance if updating
-            
-        Returns:
-            bool: True if room is available, False otherwise
-        """
-        # Query for overlapping bookings
-        overlapping_bookings = Booking.objects.filter(
-            room=room,
-            date=date,
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        )
+        # Check if end time is after start time
+        if start_time is not None and end_time is not None and end_time <= start_time:
+            raise serializers.ValidationError({'end_time': 'End time must be after start time.'})
         
-        # If updating, exclude the current instance
-        if instance:
-            overlapping_bookings = overlapping_bookings.exclude(pk=instance.pk)
-            
-        return not overlapping_bookings.exists()
-    
-    def _is_user_available(self, user: User, date: Any, start_time: Any, 
-                          end_time: Any, instance: Booking = None) -> bool:
-        """
-        Check if the user has other bookings that overlap with this one.
+        # Items of a bulk request are checked together by BookingListSerializer
+        if isinstance(self.parent, BookingListSerializer):
+            return data
         
-        Args:
-            user: User object
-            date: Booking date
-            start_time: Start time
-            end_time: End time
-            instance: Current booking instance if updating
+        # Check room availability
+        if room is not None and date is not None and start_time is not None and end_time is not None:
+            # For existing booking, exclude the current instance and check
+            # against its owner rather than whoever is editing it
+            instance = self.instance
+            booking = Booking(
+                pk=instance.pk if instance else None,
+                user=instance.user if instance else self.context['request'].user,
+                room=room,
+                date=date,
+                start_time=start_time,
+                end_time=end_time
+            )
             
-        Returns:
-            bool: True if user is available, False otherwise
-        """
-        # Query for overlapping bookings
-        overlapping_bookings = Booking.objects.filter(
-            user=user,
-            date=date,
-            start_time__lt=end_time,
-            end_time__gt=start_time
-        )
+            # Check room and user availability in a single query
+            try:
+                booking.validate_overlap()
+            except DjangoValidationError as exc:
+                raise serializers.ValidationError(exc.message_dict)
         
-        # If updating, exclude the current instance
-        if instance:
-            overlapping_bookings = overlapping_bookings.exclude(pk=instance.pk)
-            
-        return not overlapping_bookings.exists()
+        return data
         
     def create(self, validated_data: Dict[str, Any]) -> Booking:
         """
@@ -152,14 +265,17 @@ class BookingSerializer(serializers.ModelSerializer):
         Returns:
             Booking: Created booking
         """
-        with transaction.atomic():
-            # Set the user to the current user
-            validated_data['user'] = self.context['request'].user
-            
-            # Create the booking
-            booking = Booking.objects.create(**validated_data)
+        # Set the user to the current user
+        validated_data['user'] = self.context['request'].user
+        
+        # The savepoint keeps an outer transaction usable after a violation
+        try:
+            with transaction.atomic():
+                booking = Booking.objects.create(**validated_data)
+        except IntegrityError as exc:
+            raise self._overlap_error(exc)
             
-            return booking
+        return booking
             
     def update(self, instance: Booking, validated_data: Dict[str, Any]) -> Booking:
         """
@@ -172,12 +288,33 @@ class BookingSerializer(serializers.ModelSerializer):
         Returns:
             Booking: Updated booking
         """
-        with transaction.atomic():
-            # Update the fields
-            for attr, value in validated_data.items():
-                setattr(instance, attr, value)
-                
-            # Save the instance
-            instance.save()
+        # Update the fields
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
             
-            return instance 
\ No newline at end of file
+        # Save only the changed columns, in a savepoint so an outer
+        # transaction stays usable after a violation
+        try:
+            with transaction.atomic():
+                instance.save(update_fields=[*validated_data, 'updated_at'])
+        except IntegrityError as exc:
+            raise self._overlap_error(exc)
+            
+        return instance
+    
+    def _overlap_error(self, exc: IntegrityError) -> Exception:
+        """
+        Translate a violated booking exclusion constraint into a validation error.
+        
+        Args:
+            exc: IntegrityError raised by the database
+            
+        Returns:
+            Exception: ValidationError for an overlap, otherwise the original error
+        """
+        for constraint in Booking._meta.constraints:
+            if isinstance(constraint, ExclusionConstraint) and constraint.name in str(exc):
+                return serializers.ValidationError({
+                    'non_field_errors': constraint.get_violation_error_message()
+                })
+        return exc
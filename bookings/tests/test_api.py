@@ -1,7 +1,6 @@
 import pytest
 from django.urls import reverse
-from django.utils import timezone
-from datetime import timedelta, time
+from datetime import time
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
@@ -50,16 +49,6 @@ class TestBookingAPI:
             floor=2
         )
         
-    @pytest.fixture
-    def today(self):
-        """Return today's date."""
-        return timezone.now().date()
-        
-    @pytest.fixture
-    def tomorrow(self, today):
-        """Return tomorrow's date."""
-        return today + timedelta(days=1)
-    
     def test_find_available_rooms(self, api_client, user, room1, room2, today):
         """Test finding available rooms for a specific time slot."""
         # Create a booking for room1 from 10:00 to 11:00
@@ -192,29 +181,29 @@ class TestBookingAPI:
     def test_booking_statistics(self, api_client, user, room1, room2, today, tomorrow):
         """Test retrieving user's booking statistics."""
         # Create a series of bookings
-        Booking.objects.create(
-            user=user,
-            room=room1,
-            date=today,
-            start_time=time(9, 0),
-            end_time=time(10, 0)
-        )
-        
-        Booking.objects.create(
-            user=user,
-            room=room2,
-            date=today,
-            start_time=time(14, 0),
-            end_time=time(15, 0)
-        )
-        
-        Booking.objects.create(
-            user=user,
-            room=room1,
-            date=tomorrow,
-            start_time=time(11, 0),
-            end_time=time(12, 0)
-        )
+        Booking.bulk_safe_create([
+            Booking(
+                user=user,
+                room=room1,
+                date=today,
+                start_time=time(9, 0),
+                end_time=time(10, 0)
+            ),
+            Booking(
+                user=user,
+                room=room2,
+                date=today,
+                start_time=time(14, 0),
+                end_time=time(15, 0)
+            ),
+            Booking(
+                user=user,
+                room=room1,
+                date=tomorrow,
+                start_time=time(11, 0),
+                end_time=time(12, 0)
+            ),
+        ])
         
         # Authenticate user
         api_client.force_authenticate(user=user)
@@ -1,10 +1,10 @@
 import pytest
-from django.utils import timezone
 from datetime import date, time, timedelta
 from rooms.models import Room
-from bookings.models import Booking
+from bookings.models import Booking, ROOM_OVERLAP_MESSAGE
 from django.contrib.auth import get_user_model
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
 
 User = get_user_model()
 
@@ -43,9 +43,8 @@ class TestBookingModel:
         )
         
     @pytest.fixture
-    def booking(self, room, user):
+    def booking(self, room, user, today):
         """Create a test booking for today."""
-        today = timezone.now().date()
         return Booking.objects.create(
             user=user,
             room=room,
@@ -54,24 +53,21 @@ class TestBookingModel:
             end_time=time(11, 0)
         )
     
-    def test_booking_creation(self, booking, room, user):
+    def test_booking_creation(self, booking, room, user, today):
         """Test Booking instance creation."""
-        today = timezone.now().date()
         assert booking.user == user
         assert booking.room == room
         assert booking.date == today
         assert booking.start_time == time(10, 0)
         assert booking.end_time == time(11, 0)
         
-    def test_booking_str(self, booking):
+    def test_booking_str(self, booking, today):
         """Test Booking string representation."""
-        today = timezone.now().date()
         expected_str = f"Test Room - {today} 10:00:00 to 11:00:00 (by testuser)"
         assert str(booking) == expected_str
         
-    def test_booking_clean_valid(self, room, user):
+    def test_booking_clean_valid(self, room, user, today):
         """Test Booking validation with valid data."""
-        today = timezone.now().date()
         booking = Booking(
             user=user,
             room=room,
@@ -81,9 +77,9 @@ class TestBookingModel:
         )
         booking.clean()  # Should not raise any exceptions
         
-    def test_booking_clean_past_date(self, room, user):
+    def test_booking_clean_past_date(self, room, user, today):
         """Test Booking validation with past date."""
-        yesterday = timezone.now().date() - timedelta(days=1)
+        yesterday = today - timedelta(days=1)
         booking = Booking(
             user=user,
             room=room,
@@ -96,9 +92,8 @@ class TestBookingModel:
             booking.clean()
         assert 'date' in str(exc.value)
         
-    def test_booking_clean_end_time_before_start_time(self, room, user):
+    def test_booking_clean_end_time_before_start_time(self, room, user, today):
         """Test Booking validation with end time before start time."""
-        today = timezone.now().date()
         booking = Booking(
             user=user,
             room=room,
@@ -111,9 +106,8 @@ class TestBookingModel:
             booking.clean()
         assert 'end_time' in str(exc.value)
         
-    def test_booking_clean_overlapping_room_booking(self, room, user, booking):
+    def test_booking_clean_overlapping_room_booking(self, room, user, booking, today):
         """Test Booking validation with overlapping room booking."""
-        today = timezone.now().date()
         new_booking = Booking(
             user=user,
             room=room,
@@ -126,9 +120,8 @@ class TestBookingModel:
             new_booking.clean()
         assert 'non_field_errors' in str(exc.value)
         
-    def test_booking_clean_overlapping_user_booking(self, another_room, user, booking):
+    def test_booking_clean_overlapping_user_booking(self, another_room, user, booking, today):
         """Test Booking validation with overlapping user booking."""
-        today = timezone.now().date()
         new_booking = Booking(
             user=user,
             room=another_room,
@@ -139,4 +132,62 @@ class TestBookingModel:
         
         with pytest.raises(ValidationError) as exc:
             new_booking.clean()
-        assert 'non_field_errors' in str(exc.value) 
\ No newline at end of file
+        assert 'non_field_errors' in str(exc.value)
+        
+    def test_booking_full_clean_reports_overlap_once(self, room, user, booking, today):
+        """Test full_clean reports an overlap from clean() only, not again from the constraints."""
+        new_booking = Booking(
+            user=user,
+            room=room,
+            date=today,
+            start_time=time(10, 30),
+            end_time=time(11, 30)
+        )
+        
+        with pytest.raises(ValidationError) as exc:
+            new_booking.full_clean()
+        assert exc.value.message_dict == {'non_field_errors': [ROOM_OVERLAP_MESSAGE]}
+        
+    def test_booking_clean_overlap_single_query(self, another_room, user, booking, django_assert_num_queries, today):
+        """Test Booking validation checks room and user overlaps in one query."""
+        new_booking = Booking(
+            user=user,
+            room=another_room,
+            date=today,
+            start_time=time(12, 0),
+            end_time=time(13, 0)
+        )
+        
+        with django_assert_num_queries(1):
+            new_booking.clean()
+        
+    def test_booking_overlap_rejected_by_database(self, another_room, user, booking, today):
+        """Test the exclusion constraint rejects overlaps that skip validation."""
+        with pytest.raises(IntegrityError), transaction.atomic():
+            Booking.objects.create(
+                user=user,
+                room=another_room,
+                date=today,
+                start_time=time(10, 30),
+                end_time=time(11, 30)
+            )
+        
+    def test_bulk_safe_create_skips_overlaps(self, room, another_room, user, booking, today):
+        """Test bulk creation inserts valid bookings and skips overlapping ones."""
+        Booking.bulk_safe_create([
+            # Overlaps the existing booking's room
+            Booking(user=user, room=room, date=today, start_time=time(10, 30), end_time=time(11, 30)),
+            Booking(user=user, room=another_room, date=today, start_time=time(12, 0), end_time=time(13, 0)),
+            # Overlaps the previous item for the same user
+            Booking(user=user, room=room, date=today, start_time=time(12, 30), end_time=time(13, 30)),
+        ])
+        
+        assert list(
+            Booking.objects.filter(user=user).values_list('start_time', flat=True)
+        ) == [time(10, 0), time(12, 0)]
+        
+    def test_overlapping_joins_room(self, room, booking, django_assert_num_queries):
+        """Test iterating overlapping bookings loads their rooms in the same query."""
+        with django_assert_num_queries(1):
+            clashes = list(Booking.objects.overlapping(booking.date, time(10, 30), time(11, 30)))
+            assert [clash.room.name for clash in clashes] == [room.name]
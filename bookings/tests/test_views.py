@@ -1,12 +1,12 @@
 import pytest
 from django.urls import reverse
-from django.utils import timezone
 from datetime import timedelta, time
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.contrib.auth import get_user_model
 from rooms.models import Room
 from bookings.models import Booking
+from bookings.serializers import BookingListSerializer
 from typing import Dict, Any
 
 User = get_user_model()
@@ -60,9 +60,8 @@ class TestBookingViewSet:
         )
         
     @pytest.fixture
-    def booking(self, room, user):
+    def booking(self, room, user, today):
         """Create a test booking."""
-        today = timezone.now().date()
         return Booking.objects.create(
             user=user,
             room=room,
@@ -72,9 +71,8 @@ class TestBookingViewSet:
         )
         
     @pytest.fixture
-    def other_user_booking(self, room, another_user):
+    def other_user_booking(self, room, another_user, today):
         """Create a booking for another user."""
-        today = timezone.now().date()
         return Booking.objects.create(
             user=another_user,
             room=room,
@@ -84,10 +82,8 @@ class TestBookingViewSet:
         )
         
     @pytest.fixture
-    def booking_data(self, room) -> Dict[str, Any]:
+    def booking_data(self, room, tomorrow) -> Dict[str, Any]:
         """Return valid booking data."""
-        today = timezone.now().date()
-        tomorrow = today + timedelta(days=1)
         return {
             'room_id': room.id,
             'date': str(tomorrow),
@@ -293,28 +289,28 @@ class TestBookingViewSet:
         # Check the booking was deleted
         assert not Booking.objects.filter(id=booking.id).exists()
         
-    def test_filter_bookings_by_date(self, api_client, user):
+    def test_filter_bookings_by_date(self, api_client, user, today):
         """Test filtering bookings by date."""
         # Create bookings on different dates
         room = Room.objects.create(name="Filter Room", capacity=10, floor=1)
-        today = timezone.now().date()
         tomorrow = today + timedelta(days=1)
         
-        Booking.objects.create(
-            user=user,
-            room=room,
-            date=today,
-            start_time=time(10, 0),
-            end_time=time(11, 0)
-        )
-        
-        Booking.objects.create(
-            user=user,
-            room=room,
-            date=tomorrow,
-            start_time=time(10, 0),
-            end_time=time(11, 0)
-        )
+        Booking.objects.bulk_create([
+            Booking(
+                user=user,
+                room=room,
+                date=today,
+                start_time=time(10, 0),
+                end_time=time(11, 0)
+            ),
+            Booking(
+                user=user,
+                room=room,
+                date=tomorrow,
+                start_time=time(10, 0),
+                end_time=time(11, 0)
+            ),
+        ])
         
         # Filter by today
         api_client.force_authenticate(user=user)
@@ -326,28 +322,28 @@ class TestBookingViewSet:
         assert len(response.data['results']) == 1
         assert response.data['results'][0]['date'] == str(today)
         
-    def test_filter_bookings_by_room(self, api_client, user):
+    def test_filter_bookings_by_room(self, api_client, user, today):
         """Test filtering bookings by room."""
         # Create bookings for different rooms
         room1 = Room.objects.create(name="Room 1", capacity=10, floor=1)
         room2 = Room.objects.create(name="Room 2", capacity=15, floor=2)
-        today = timezone.now().date()
         
-        booking1 = Booking.objects.create(
-            user=user,
-            room=room1,
-            date=today,
-            start_time=time(10, 0),
-            end_time=time(11, 0)
-        )
-        
-        Booking.objects.create(
-            user=user,
-            room=room2,
-            date=today,
-            start_time=time(13, 0),
-            end_time=time(14, 0)
-        )
+        booking1, _ = Booking.objects.bulk_create([
+            Booking(
+                user=user,
+                room=room1,
+                date=today,
+                start_time=time(10, 0),
+                end_time=time(11, 0)
+            ),
+            Booking(
+                user=user,
+                room=room2,
+                date=today,
+                start_time=time(13, 0),
+                end_time=time(14, 0)
+            ),
+        ])
         
         # Filter by room1
         api_client.force_authenticate(user=user)
@@ -357,4 +353,88 @@ class TestBookingViewSet:
         # Check response
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 1
-        assert response.data['results'][0]['id'] == booking1.id 
\ No newline at end of file
+        assert response.data['results'][0]['id'] == booking1.id
+        
+    def test_list_bookings_query_count(self, api_client, admin_user, booking, other_user_booking, django_assert_num_queries):
+        """Test listing bookings joins users and rooms instead of querying per row."""
+        api_client.force_authenticate(user=admin_user)
+        url = reverse('booking-list')
+        
+        # A short first page is counted from its own rows, so no COUNT query
+        with django_assert_num_queries(1):
+            response = api_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 2
+        assert response.data['results'][0]['user']['username'] == booking.user.username
+        assert response.data['results'][0]['room']['name'] == booking.room.name
+        
+    def test_create_bookings_in_bulk(self, api_client, user, room, booking_data):
+        """Test creating several bookings from a list payload."""
+        api_client.force_authenticate(user=user)
+        url = reverse('booking-list')
+        
+        later_booking_data = dict(booking_data, start_time='16:00:00', end_time='17:00:00')
+        response = api_client.post(url, [booking_data, later_booking_data], format='json')
+        
+        # Check response
+        assert response.status_code == status.HTTP_201_CREATED
+        assert len(response.data) == 2
+        assert Booking.objects.filter(user=user, date=booking_data['date']).count() == 2
+        
+    def test_create_bookings_in_bulk_with_conflict(self, api_client, user, booking, booking_data):
+        """Test a bulk create is rejected as a whole if any item overlaps."""
+        api_client.force_authenticate(user=user)
+        url = reverse('booking-list')
+        
+        conflict_data = {
+            'room_id': booking.room.id,
+            'date': str(booking.date),
+            'start_time': '10:30:00',  # Overlaps with 10:00-11:00
+            'end_time': '11:30:00'
+        }
+        clashing_item_data = dict(booking_data, start_time='15:30:00', end_time='16:30:00')
+        response = api_client.post(url, [booking_data, conflict_data, clashing_item_data], format='json')
+        
+        # Should return 400 Bad Request with an error for each overlapping item
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data[0] == {}
+        assert 'non_field_errors' in response.data[1]
+        assert 'non_field_errors' in response.data[2]
+        
+        # No booking should be created
+        assert Booking.objects.count() == 1
+        
+    def test_create_bookings_in_bulk_over_batch_limit(self, api_client, user, booking_data):
+        """Test a bulk create larger than the batch limit is rejected before validation."""
+        api_client.force_authenticate(user=user)
+        url = reverse('booking-list')
+        
+        payload = [booking_data] * (BookingListSerializer.max_batch_size + 1)
+        response = api_client.post(url, payload, format='json')
+        
+        # Should return 400 Bad Request without creating anything
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'non_field_errors' in response.data
+        assert Booking.objects.count() == 0
+        
+    def test_filter_bookings_by_invalid_date(self, api_client, user, booking):
+        """Test filtering bookings by a malformed date is rejected."""
+        api_client.force_authenticate(user=user)
+        url = reverse('booking-list')
+        response = api_client.get(url, {'date': 'not-a-date'})
+        
+        # Check response
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'date' in response.data
+        
+    @pytest.mark.parametrize('room_param', ['x', '²'])
+    def test_filter_bookings_by_invalid_room(self, api_client, user, booking, room_param):
+        """Test filtering bookings by a malformed room id is rejected."""
+        api_client.force_authenticate(user=user)
+        url = reverse('booking-list')
+        response = api_client.get(url, {'room': room_param})
+        
+        # Check response
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'room' in response.data
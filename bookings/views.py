@@ -1,12 +1,12 @@
-from django.shortcuts import render
 from rest_framework import viewsets, filters, status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
-from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.exceptions import ValidationError
 from .models import Booking
 from .serializers import BookingSerializer
 from core.permissions import IsOwnerOrAdmin
 from django.db.models import QuerySet
+from django.utils.dateparse import parse_date
 from typing import Any
 
 
@@ -23,10 +23,15 @@ class BookingViewSet(viewsets.ModelViewSet):
     """
     serializer_class = BookingSerializer
     permission_classes = [IsAuthenticated, IsOwnerOrAdmin]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['date', 'room']
+    filter_backends = [filters.OrderingFilter]
     ordering_fields = ['date', 'start_time', 'end_time']
     ordering = ['date', 'start_time']
+    list_only_fields = [
+        'id', 'date', 'start_time', 'end_time', 'created_at', 'updated_at',
+        'user__id', 'user__username', 'user__email', 'user__first_name', 'user__last_name',
+        'room__id', 'room__name', 'room__capacity', 'room__floor',
+        'room__created_at', 'room__updated_at',
+    ]
     
     def get_queryset(self) -> QuerySet:
         """
@@ -38,45 +43,63 @@ class BookingViewSet(viewsets.ModelViewSet):
             
         user = self.request.user
         
+        # Let the serializer join the relations it renders to avoid N+1 queries
+        queryset = self.get_serializer_class().prefetch_queryset(Booking.objects.all())
+        
+        # Only load the columns the serializer renders when listing
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
+        
         # Admin can see all bookings
         if user.is_staff:
-            return Booking.objects.all()
+            return queryset.all()
             
         # Regular users can only see their own bookings
-        return Booking.objects.filter(user=user)
+        return queryset.filter(user=user)
         
-    def create(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+    def filter_queryset(self, queryset: QuerySet) -> QuerySet:
         """
-        Create a new booking.
-        """
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        self.perform_create(serializer)
-        headers = self.get_success_headers(serializer.data)
-        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=headers)
+        Filter by the ``date`` and ``room`` query parameters, then order.
         
-    def perform_create(self, serializer: BookingSerializer) -> None:
-        """
-        Set the user to the current user when creating a booking.
+        The two exact-match filters are applied directly rather than through
+        a FilterSet, which would build and validate a form on every request.
         """
-        serializer.save(user=self.request.user)
+        params = self.request.query_params
+        
+        date = params.get('date')
+        if date:
+            try:
+                parsed_date = parse_date(date)
+            except ValueError:
+                parsed_date = None
+            if parsed_date is None:
+                raise ValidationError({'date': ['Enter a valid date.']})
+            queryset = queryset.filter(date=parsed_date)
+        
+        room = params.get('room')
+        if room:
+            # isdigit() alone also accepts non-ASCII digits such as '²', which int() rejects
+            if not (room.isascii() and room.isdigit()):
+                raise ValidationError({'room': ['Enter a valid room id.']})
+            queryset = queryset.filter(room_id=int(room))
         
-    def update(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+        return super().filter_queryset(queryset)
+        
+    def create(self, request: Any, *args: Any, **kwargs: Any) -> Response:
         """
-        Update a booking.
+        Create a new booking, or several at once from a list payload.
         """
-        partial = kwargs.pop('partial', False)
-        instance = self.get_object()
-        serializer = self.get_serializer(instance, data=request.data, partial=partial)
+        serializer = self.get_serializer(data=request.data, many=isinstance(request.data, list))
         serializer.is_valid(raise_exception=True)
-        self.perform_update(serializer)
+        self.perform_create(serializer)
         
-        return Response(serializer.data)
+        # Wrap the rendered data once for both the headers and the response
+        data = serializer.data
+        headers = self.get_success_headers(data)
+        return Response(data, status=status.HTTP_201_CREATED, headers=headers)
         
-    def destroy(self, request: Any, *args: Any, **kwargs: Any) -> Response:
+    def perform_create(self, serializer: BookingSerializer) -> None:
         """
-        Delete a booking.
+        Set the user to the current user when creating a booking.
         """
-        instance = self.get_object()
-        self.perform_destroy(instance)
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        serializer.save(user=self.request.user)
@@ -1,20 +1,56 @@
 import pytest
+from django.conf import settings
 from django.contrib.auth import get_user_model
-from rest_framework.test import APIClient
+from rest_framework.test import APIClient, APIRequestFactory
 from rooms.models import Room
 from bookings.models import Booking
 from django.utils import timezone
-from datetime import time
+from datetime import time, timedelta
 
 User = get_user_model()
 
 
+def pytest_configure(config):
+    """Hash test passwords with a fast hasher instead of PBKDF2."""
+    settings.PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+
 @pytest.fixture
 def api_client():
     """Return an API client."""
     return APIClient()
 
 
+@pytest.fixture
+def user_client(user):
+    """Return an API client authenticated as the regular user."""
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def admin_client(admin_user):
+    """Return an API client authenticated as the admin user."""
+    client = APIClient()
+    client.force_authenticate(user=admin_user)
+    return client
+
+
+@pytest.fixture(scope="module")
+def request_factory():
+    """Return a request factory shared by the tests in a module."""
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def drf_request(request_factory, user):
+    """Return a request made by the test user."""
+    request = request_factory.post('/')
+    request.user = user
+    return request
+
+
 @pytest.fixture
 def user():
     """Create a regular user."""
@@ -46,10 +82,21 @@ def room():
     )
 
 
+@pytest.fixture(scope="session")
+def today():
+    """Return today's date, resolved once per test session."""
+    return timezone.now().date()
+
+
+@pytest.fixture(scope="session")
+def tomorrow(today):
+    """Return tomorrow's date."""
+    return today + timedelta(days=1)
+
+
 @pytest.fixture
-def booking(room, user):
+def booking(room, user, today):
     """Create a test booking for today."""
-    today = timezone.now().date()
     return Booking.objects.create(
         user=user,
         room=room,
@@ -0,0 +1,31 @@
+from django.core.paginator import Page, Paginator
+from rest_framework.pagination import PageNumberPagination
+from typing import Any
+
+
+class ShortFirstPagePaginator(Paginator):
+    """
+    Paginator that skips the COUNT query when the first page is not full.
+
+    A short first page already holds every row, so its length is the count.
+    """
+
+    def page(self, number: Any) -> Page:
+        if self.orphans or str(number) != '1' or 'count' in self.__dict__:
+            return super().page(number)
+
+        # Fetch the first page before counting; a full page still needs COUNT
+        rows = list(self.object_list[:self.per_page])
+        if len(rows) < self.per_page:
+            self.count = len(rows)
+
+        if not rows and not self.allow_empty_first_page:
+            return super().page(number)
+        return self._get_page(rows, 1, self)
+
+
+class ShortFirstPagePagination(PageNumberPagination):
+    """
+    Page number pagination that avoids COUNT on single-page results.
+    """
+    django_paginator_class = ShortFirstPagePaginator
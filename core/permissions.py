@@ -27,8 +27,6 @@ class IsOwnerOrAdmin(permissions.BasePermission):
         if request.user and request.user.is_staff:
             return True
         
-        # Check if obj has a user field
-        if hasattr(obj, 'user'):
-            return obj.user == request.user
-            
-        return False 
\ No newline at end of file
+        # Compare the user foreign key column so the owner is never loaded
+        owner_id = getattr(obj, 'user_id', None)
+        return owner_id is not None and owner_id == request.user.pk
@@ -0,0 +1,60 @@
+import math
+import orjson
+from rest_framework.renderers import JSONRenderer
+from typing import Any, Mapping, Optional
+
+
+def has_non_finite_float(data: Any) -> bool:
+    """
+    Return whether ``data`` contains a NaN or infinite float anywhere.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSON renderer that serializes with orjson.
+
+    Datetimes and any type orjson does not handle natively go through DRF's
+    encoder, so the output matches JSONRenderer. Indented responses, data
+    orjson cannot encode and non-finite floats are left to JSONRenderer
+    itself.
+    """
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(
+        self,
+        data: Any,
+        accepted_media_type: Optional[str] = None,
+        renderer_context: Optional[Mapping[str, Any]] = None,
+    ) -> bytes:
+        if data is None:
+            return b''
+
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=self.options)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson writes NaN and Infinity as null, where JSONRenderer rejects
+        # them under STRICT_JSON (or writes them as-is when not strict)
+        if b'null' in ret and has_non_finite_float(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Escape the line separators JSON allows but JavaScript does not,
+        # as JSONRenderer does
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
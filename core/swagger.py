@@ -1,12 +1,8 @@
+from functools import lru_cache
 from rest_framework import permissions
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
-from django.urls import re_path
-
-schema_info = openapi.Info(
-    title="Meeting Room Booking API",
-    default_version='v1',
-    description="""
+from typing import Any, Callable, Optional
+
+SCHEMA_DESCRIPTION = """
 # Meeting Room Booking API Documentation
 
 This API provides functionality for booking meeting rooms in an office.
@@ -34,14 +30,46 @@ Example: `Authorization: Bearer <your_access_token>`
 - **Users**: User profile management
 - **Rooms**: Room CRUD operations, filtering by availability
 - **Bookings**: Booking CRUD operations
-    """,
-    terms_of_service="https://www.example.com/terms/",
-    contact=openapi.Contact(email="contact@example.com"),
-    license=openapi.License(name="BSD License"),
-)
-
-schema_view = get_schema_view(
-    schema_info,
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-) 
\ No newline at end of file
+    """
+
+
+@lru_cache(maxsize=None)
+def get_cached_schema_view() -> Any:
+    """
+    Build the schema view on first use so drf_yasg's generators and
+    inspectors are only imported when the documentation is requested.
+    """
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+
+    schema_info = openapi.Info(
+        title="Meeting Room Booking API",
+        default_version='v1',
+        description=SCHEMA_DESCRIPTION,
+        terms_of_service="https://www.example.com/terms/",
+        contact=openapi.Contact(email="contact@example.com"),
+        license=openapi.License(name="BSD License"),
+    )
+    return get_schema_view(
+        schema_info,
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+@lru_cache(maxsize=None)
+def _get_docs_view(renderer: Optional[str]) -> Callable:
+    schema_view = get_cached_schema_view()
+    if renderer is None:
+        return schema_view.without_ui(cache_timeout=0)
+    return schema_view.with_ui(renderer, cache_timeout=0)
+
+
+def docs_view(renderer: Optional[str] = None) -> Callable:
+    """
+    Return a URL view for the schema, rendered with the given UI or as raw
+    JSON/YAML when no renderer is given.
+    """
+    def view(request: Any, *args: Any, **kwargs: Any) -> Any:
+        return _get_docs_view(renderer)(request, *args, **kwargs)
+    return view
@@ -0,0 +1,32 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+from core.renderers import ORJSONRenderer
+
+
+@pytest.mark.unit
+class TestORJSONRenderer:
+    """Test suite for ORJSONRenderer."""
+
+    def test_render_matches_json_renderer(self):
+        """Test that ordinary data renders exactly as JSONRenderer does."""
+        data = {'name': 'Room A', 'capacity': 10, 'amenities': ['Projector'], 'next': None}
+
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_render_int_keyed_dict(self):
+        """Test that non-string keys are written as strings, as JSONRenderer does."""
+        data = {1: 'Room A', 2: {3: 'Room B'}}
+
+        rendered = ORJSONRenderer().render(data)
+
+        assert rendered == JSONRenderer().render(data)
+        assert rendered == b'{"1":"Room A","2":{"3":"Room B"}}'
+
+    def test_render_nan_is_rejected(self):
+        """Test that a NaN float is rejected under STRICT_JSON, as JSONRenderer does."""
+        data = {'rating': float('nan'), 'next': None}
+
+        with pytest.raises(ValueError):
+            JSONRenderer().render(data)
+        with pytest.raises(ValueError):
+            ORJSONRenderer().render(data)
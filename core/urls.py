@@ -17,7 +17,7 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path, include
 from django.views.generic import TemplateView
-from .swagger import schema_view
+from .swagger import docs_view
 
 urlpatterns = [
     # Admin
@@ -29,9 +29,9 @@ urlpatterns = [
     path('api/v1/', include('bookings.urls')),
     
     # API Documentation
-    path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
-    path('swagger<str:format>/', schema_view.without_ui(cache_timeout=0), name='schema-json'),
-    path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
+    path('swagger/', docs_view('swagger'), name='schema-swagger-ui'),
+    path('swagger<str:format>/', docs_view(), name='schema-json'),
+    path('redoc/', docs_view('redoc'), name='schema-redoc'),
     
     # Landing page
     path('', TemplateView.as_view(template_name='index.html'), name='api-root'),
@@ -7,5 +7,8 @@ CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 -- Create extension for full text search if needed
 CREATE EXTENSION IF NOT EXISTS "pg_trgm";
 
+-- Create extension for the booking overlap exclusion constraints
+CREATE EXTENSION IF NOT EXISTS "btree_gist";
+
 -- Grant privileges
 GRANT ALL PRIVILEGES ON DATABASE booking_db TO booking_user; 
\ No newline at end of file
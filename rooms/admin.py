@@ -6,5 +6,5 @@ from .models import Room
 class RoomAdmin(admin.ModelAdmin):
     list_display = ('name', 'capacity', 'floor', 'created_at', 'updated_at')
     list_filter = ('floor', 'capacity')
-    search_fields = ('name', 'floor')
+    search_fields = ('name',)
     ordering = ('floor', 'name')
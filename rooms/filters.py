@@ -1,7 +1,11 @@
 import django_filters
+from django_filters.constants import EMPTY_VALUES
 from .models import Room
-from django.db.models import Q
-from typing import Any, Dict
+from django.db.models import Exists, OuterRef
+from django.utils.dateparse import parse_time
+from rest_framework.exceptions import ValidationError
+from datetime import time
+from typing import Any, Dict, Optional
 
 
 class RoomFilter(django_filters.FilterSet):
@@ -16,26 +20,56 @@ class RoomFilter(django_filters.FilterSet):
     floor = django_filters.NumberFilter(field_name='floor')
     capacity = django_filters.NumberFilter(field_name='capacity', lookup_expr='gte')
     date = django_filters.DateFilter(method='filter_availability')
-    start_time = django_filters.TimeFilter(method='filter_ignored')
-    end_time = django_filters.TimeFilter(method='filter_ignored')
     
     class Meta:
         model = Room
-        fields = ['floor', 'capacity', 'date', 'start_time', 'end_time']
+        fields = ['floor', 'capacity', 'date']
     
-    def filter_ignored(self, queryset, name, value) -> Any:
+    def get_form_class(self) -> Any:
         """
-        Placeholder filter method that doesn't filter.
-        These parameters are actually used in filter_availability.
+        Build the validation form class once per FilterSet class.
+        
+        The declared filters never vary per request, so the generated form
+        class (and the form fields behind it) can be shared.
+        
+        Returns:
+            type: Form class for the filter data
+        """
+        form_class = type(self).__dict__.get('_form_class')
+        if form_class is None:
+            form_class = super().get_form_class()
+            type(self)._form_class = form_class
+        return form_class
+        
+    def filter_queryset(self, queryset: Any) -> Any:
+        """
+        Filter the queryset with the validated parameters.
+        
+        Plain field lookups are applied in a single filter() call rather
+        than one queryset clone per parameter; method filters such as the
+        availability check run afterwards.
         
         Args:
             queryset: QuerySet to filter
-            name: Name of the filter field
-            value: Filter value
             
         Returns:
-            QuerySet: Unfiltered queryset
+            QuerySet: Filtered queryset
         """
+        lookups: Dict[str, Any] = {}
+        deferred = []
+        for name, value in self.form.cleaned_data.items():
+            if value in EMPTY_VALUES:
+                continue
+            filter_ = self.filters[name]
+            if filter_.method or filter_.exclude or filter_.distinct:
+                deferred.append((filter_, value))
+            else:
+                lookups[f'{filter_.field_name}__{filter_.lookup_expr}'] = value
+        
+        if lookups:
+            queryset = queryset.filter(**lookups)
+        for filter_, value in deferred:
+            queryset = filter_.filter(queryset, value)
         return queryset
         
     def filter_availability(self, queryset, name, value) -> Any:
@@ -50,18 +84,43 @@ class RoomFilter(django_filters.FilterSet):
         Returns:
             QuerySet: Filtered queryset
         """
-        # Get start_time and end_time from filters
-        start_time = self.data.get('start_time')
-        end_time = self.data.get('end_time')
+        # start_time and end_time are read here rather than declared as
+        # filters, so they are not dispatched as no-op filters of their own
+        start_time = self.parse_time_param('start_time')
+        end_time = self.parse_time_param('end_time')
         
         # If any parameter is missing, return all rooms
-        if not all([value, start_time, end_time]):
+        if not (value and start_time and end_time):
             return queryset
             
-        # Check availability for each room
-        available_rooms = []
-        for room in queryset:
-            if room.is_available(value, start_time, end_time):
-                available_rooms.append(room.id)
-                
-        return queryset.filter(id__in=available_rooms) 
\ No newline at end of file
+        # Reuse the availability RoomViewSet already annotated for this slot
+        if 'slot_available' in queryset.query.annotations:
+            return queryset.filter(slot_available=True)
+        
+        # Exclude rooms with an overlapping booking in one query
+        from bookings.models import Booking
+        
+        conflicts = Booking.objects.overlapping(value, start_time, end_time).filter(room=OuterRef('pk'))
+        return queryset.filter(~Exists(conflicts))
+        
+    def parse_time_param(self, name: str) -> Optional[time]:
+        """
+        Parse a time query parameter.
+        
+        Args:
+            name: Name of the query parameter
+            
+        Returns:
+            time: Parsed time, or None if the parameter is missing
+        """
+        value = self.data.get(name)
+        if not value:
+            return None
+        
+        try:
+            parsed = parse_time(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise ValidationError({name: ['Enter a valid time.']})
+        return parsed
\ No newline at end of file
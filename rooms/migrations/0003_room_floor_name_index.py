@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-14 11:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rooms', '0002_room_name_upper_trgm'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='room',
+            name='rooms_room_floor_e5a342_idx',
+        ),
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['floor', 'name'], name='rooms_floor_name_idx'),
+        ),
+    ]
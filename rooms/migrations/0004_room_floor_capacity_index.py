@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 11:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rooms', '0003_room_floor_name_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='room',
+            index=models.Index(fields=['floor', 'capacity'], name='rooms_floor_capacity_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.core.validators import MinValueValidator
 from typing import Optional
 
@@ -18,8 +20,13 @@ class Room(models.Model):
         verbose_name = 'Meeting Room'
         verbose_name_plural = 'Meeting Rooms'
         indexes = [
-            models.Index(fields=['floor']),
+            # Leads with floor for floor filters and matches the default ordering
+            models.Index(fields=['floor', 'name'], name='rooms_floor_name_idx'),
+            # Serves the combined floor and minimum-capacity filter
+            models.Index(fields=['floor', 'capacity'], name='rooms_floor_capacity_idx'),
             models.Index(fields=['capacity']),
+            # Trigram index matching the UPPER(name) LIKE of icontains searches
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='room_name_upper_trgm'),
         ]
 
     def __str__(self) -> str:
@@ -39,15 +46,5 @@ class Room(models.Model):
         """
         from bookings.models import Booking
         
-        # Check for any overlapping bookings
-        overlapping_bookings = Booking.objects.filter(
-            room=self,
-            date=date,
-        ).filter(
-            # Case 1: Start time of new booking is during an existing booking
-            # Case 2: End time of new booking is during an existing booking
-            # Case 3: New booking completely contains an existing booking
-            models.Q(start_time__lt=end_time, end_time__gt=start_time)
-        )
-        
-        return not overlapping_bookings.exists()
+        # One EXISTS probe on the room's overlapping bookings, by FK column
+        return not Booking.objects.overlapping(date, start_time, end_time).filter(room_id=self.pk).exists()
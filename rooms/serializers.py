@@ -1,11 +1,6 @@
 from rest_framework import serializers
+from django.utils.dateparse import parse_date, parse_time
 from .models import Room
-from typing import Dict, Any
-from django.utils import timezone
-from datetime import datetime
-from django.utils.dateparse import parse_date
-from django.db import models
-from bookings.models import Booking
 
 
 class RoomSerializer(serializers.ModelSerializer):
@@ -14,27 +9,8 @@ class RoomSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Room
-        fields = ['id', 'name', 'capacity', 'floor', 'created_at', 'updated_at']
-        read_only_fields = ['id', 'created_at', 'updated_at']
-
-    def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Validate room data.
-        
-        Args:
-            data: Data to validate
-            
-        Returns:
-            Dict[str, Any]: Validated data
-        """
-        # Ensure floor and capacity are positive
-        if data.get('floor', 0) <= 0:
-            raise serializers.ValidationError({'floor': 'Floor must be a positive number.'})
-        
-        if data.get('capacity', 0) <= 0:
-            raise serializers.ValidationError({'capacity': 'Capacity must be a positive number.'})
-        
-        return data
+        fields = ('id', 'name', 'capacity', 'floor', 'created_at', 'updated_at')
+        read_only_fields = ('id', 'created_at', 'updated_at')
 
 
 class RoomDetailSerializer(RoomSerializer):
@@ -44,11 +20,11 @@ class RoomDetailSerializer(RoomSerializer):
     is_available = serializers.SerializerMethodField()
     
     class Meta(RoomSerializer.Meta):
-        fields = RoomSerializer.Meta.fields + ['is_available']
+        fields = RoomSerializer.Meta.fields + ('is_available',)
     
     def get_is_available(self, obj: Room) -> bool:
         """
-        Get room availability for the specified date and time.
+        Get room availability for the slot given in the request's query params.
         
         Args:
             obj: Room object
@@ -56,33 +32,26 @@ class RoomDetailSerializer(RoomSerializer):
         Returns:
             bool: True if the room is available, False otherwise
         """
+        # Use the availability annotated by RoomViewSet's queryset when present
+        slot_available = getattr(obj, 'slot_available', None)
+        if slot_available is not None:
+            return slot_available
+        
         request = self.context.get('request')
-        if not request or not hasattr(request, 'query_params'):
+        if not request:
             return True
-            
-        date = request.query_params.get('date')
-        start_time = request.query_params.get('start_time')
-        end_time = request.query_params.get('end_time')
         
-        if not all([date, start_time, end_time]):
+        # Without a complete, well-formed slot the room counts as available
+        params = getattr(request, 'query_params', request.GET)
+        try:
+            slot = (
+                parse_date(params.get('date', '')),
+                parse_time(params.get('start_time', '')),
+                parse_time(params.get('end_time', '')),
+            )
+        except ValueError:
+            return True
+        if not all(slot):
             return True
         
-        # Parse the date if it's a string
-        if isinstance(date, str):
-            try:
-                parsed_date = parse_date(date)
-                if parsed_date:
-                    date = parsed_date
-            except Exception:
-                pass
-        
-        # Check if there are any overlapping bookings
-        overlapping_bookings = Booking.objects.filter(
-            room=obj,
-            date=date,
-        ).filter(
-            models.Q(start_time__lt=end_time, end_time__gt=start_time)
-        )
-        
-        is_available = not overlapping_bookings.exists()
-        return is_available 
\ No newline at end of file
+        return obj.is_available(*slot)
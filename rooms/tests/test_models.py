@@ -1,5 +1,4 @@
 import pytest
-from django.utils import timezone
 from datetime import timedelta, time
 from rooms.models import Room
 from bookings.models import Booking
@@ -52,19 +51,16 @@ class TestRoomModel:
                 floor=4
             )
             
-    def test_room_is_available_no_bookings(self, room):
+    def test_room_is_available_no_bookings(self, room, today):
         """Test availability checking when there are no bookings."""
-        today = timezone.now().date()
         start = time(10, 0)
         end = time(11, 0)
         
         # Room should be available
         assert room.is_available(today, start, end) is True
         
-    def test_room_is_available_with_non_overlapping_booking(self, room, user):
+    def test_room_is_available_with_non_overlapping_booking(self, room, user, today):
         """Test availability checking with a booking that doesn't overlap."""
-        today = timezone.now().date()
-        
         # Create a booking from 9:00 to 10:00
         Booking.objects.create(
             user=user,
@@ -77,10 +73,8 @@ class TestRoomModel:
         # Check if room is available from 10:00 to 11:00
         assert room.is_available(today, time(10, 0), time(11, 0)) is True
         
-    def test_room_is_not_available_with_overlapping_booking(self, room, user):
+    def test_room_is_not_available_with_overlapping_booking(self, room, user, today):
         """Test availability checking with an overlapping booking."""
-        today = timezone.now().date()
-        
         # Create a booking from 10:00 to 11:00
         Booking.objects.create(
             user=user,
@@ -103,9 +97,8 @@ class TestRoomModel:
         # Case 4: Completely containing existing booking (9:30 - 12:00)
         assert room.is_available(today, time(9, 30), time(12, 0)) is False
         
-    def test_room_is_available_different_date(self, room, user):
+    def test_room_is_available_different_date(self, room, user, today):
         """Test availability checking on a different date."""
-        today = timezone.now().date()
         tomorrow = today + timedelta(days=1)
         
         # Create a booking for today
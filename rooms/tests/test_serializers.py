@@ -1,11 +1,12 @@
 import pytest
-from django.utils import timezone
 from datetime import time
 from rest_framework.test import APIRequestFactory
 from rest_framework.exceptions import ValidationError
 from rooms.models import Room
 from rooms.serializers import RoomSerializer, RoomDetailSerializer
+from bookings.models import Booking
 from django.db import models
+from django.db.models import Exists, OuterRef
 
 
 @pytest.mark.django_db
@@ -80,6 +81,15 @@ class TestRoomSerializer:
         serializer = RoomSerializer(data=data)
         assert not serializer.is_valid()
         assert 'floor' in serializer.errors
+        
+    def test_partial_update_without_floor_or_capacity(self, room):
+        """Test a partial update may omit floor and capacity."""
+        serializer = RoomSerializer(room, data={'name': 'Renamed Room'}, partial=True)
+        assert serializer.is_valid(), serializer.errors
+        
+        updated_room = serializer.save()
+        assert updated_room.name == 'Renamed Room'
+        assert updated_room.floor == room.floor
 
 
 @pytest.mark.django_db
@@ -116,8 +126,7 @@ class TestRoomDetailSerializer:
         # Test that the room is available at a different time
         assert room.is_available(test_date, '12:00:00', '13:00:00') is True
         
-        # Part 2: Test RoomDetailSerializer (temporarily skipped)
-        # TODO: Fix the serializer test to properly detect room availability
+        # Part 2: Test RoomDetailSerializer falls back to the request's slot
         factory = APIRequestFactory()
         
         # Create requests for booked and available times
@@ -137,6 +146,10 @@ class TestRoomDetailSerializer:
         unavailable_serializer = RoomDetailSerializer(room, context={'request': unavailable_request})
         available_serializer = RoomDetailSerializer(room, context={'request': available_request})
         
+        # Without the view's annotation, availability is checked per room
+        assert unavailable_serializer.data['is_available'] is False
+        assert available_serializer.data['is_available'] is True
+        
     def test_room_availability_with_incomplete_params(self, room):
         """Test room availability when query params are incomplete."""
         factory = APIRequestFactory()
@@ -151,4 +164,13 @@ class TestRoomDetailSerializer:
         serializer = RoomDetailSerializer(room, context={'request': request})
         
         # Room should be available (default) when params are incomplete
-        assert serializer.data['is_available'] is True 
\ No newline at end of file
+        assert serializer.data['is_available'] is True
+        
+    def test_room_availability_from_annotation(self, room, booking, django_assert_num_queries):
+        """Test availability annotated on the queryset is used without another query."""
+        conflicts = Booking.objects.overlapping(booking.date, time(10, 30), time(11, 30)).filter(room=OuterRef('pk'))
+        annotated_room = Room.objects.annotate(slot_available=~Exists(conflicts)).get(pk=room.pk)
+        
+        serializer = RoomDetailSerializer(annotated_room)
+        with django_assert_num_queries(0):
+            assert serializer.data['is_available'] is False
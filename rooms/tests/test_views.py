@@ -1,23 +1,28 @@
 import pytest
-from django.urls import reverse
-from django.utils import timezone
+from django.urls import reverse, reverse_lazy
 from datetime import time
 from rest_framework import status
 from rest_framework.test import APIClient
 from rooms.models import Room
 
+ROOM_LIST_URL = reverse_lazy('room-list')
+
+# The slot taken by the booking fixture
+BOOKED_SLOT = {'start_time': '10:00:00', 'end_time': '11:00:00'}
+
+
+def room_detail_url(pk):
+    """Return the detail URL for the room with the given primary key."""
+    return reverse('room-detail', kwargs={'pk': pk})
+
 
 @pytest.mark.django_db
 class TestRoomViewSet:
     """Test suite for RoomViewSet API endpoints."""
 
-    def test_list_rooms(self, api_client, room, user):
+    def test_list_rooms(self, user_client, room):
         """Test listing all rooms."""
-        # Authentication required
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('room-list')
-        response = api_client.get(url)
+        response = user_client.get(ROOM_LIST_URL)
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -27,19 +32,14 @@ class TestRoomViewSet:
         
     def test_list_rooms_unauthenticated(self, api_client):
         """Test listing rooms when unauthenticated."""
-        url = reverse('room-list')
-        response = api_client.get(url)
+        response = api_client.get(ROOM_LIST_URL)
         
         # Should return 401 Unauthorized
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         
-    def test_retrieve_room(self, api_client, room, user):
+    def test_retrieve_room(self, user_client, room):
         """Test retrieving a specific room."""
-        # Authentication required
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('room-detail', kwargs={'pk': room.id})
-        response = api_client.get(url)
+        response = user_client.get(room_detail_url(room.id))
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -47,19 +47,15 @@ class TestRoomViewSet:
         assert response.data['name'] == room.name
         assert 'is_available' in response.data  # Detail serializer includes availability
         
-    def test_create_room_as_admin(self, api_client, admin_user):
+    def test_create_room_as_admin(self, admin_client):
         """Test creating a room as admin user."""
-        # Authenticate as admin
-        api_client.force_authenticate(user=admin_user)
-        
-        url = reverse('room-list')
         data = {
             'name': 'Admin Created Room',
             'capacity': 15,
             'floor': 3
         }
         
-        response = api_client.post(url, data, format='json')
+        response = admin_client.post(ROOM_LIST_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_201_CREATED
@@ -70,19 +66,15 @@ class TestRoomViewSet:
         # Check the room was created in the database
         assert Room.objects.filter(name='Admin Created Room').exists()
         
-    def test_create_room_as_regular_user(self, api_client, user):
+    def test_create_room_as_regular_user(self, user_client):
         """Test creating a room as a regular (non-admin) user."""
-        # Authenticate as regular user
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('room-list')
         data = {
             'name': 'User Created Room',
             'capacity': 10,
             'floor': 2
         }
         
-        response = api_client.post(url, data, format='json')
+        response = user_client.post(ROOM_LIST_URL, data, format='json')
         
         # Should return 403 Forbidden
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -90,19 +82,15 @@ class TestRoomViewSet:
         # Check the room was not created
         assert not Room.objects.filter(name='User Created Room').exists()
         
-    def test_update_room_as_admin(self, api_client, room, admin_user):
+    def test_update_room_as_admin(self, admin_client, room):
         """Test updating a room as admin user."""
-        # Authenticate as admin
-        api_client.force_authenticate(user=admin_user)
-        
-        url = reverse('room-detail', kwargs={'pk': room.id})
         data = {
             'name': 'Updated Room Name',
             'capacity': 25,
             'floor': 4
         }
         
-        response = api_client.put(url, data, format='json')
+        response = admin_client.put(room_detail_url(room.id), data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -116,19 +104,15 @@ class TestRoomViewSet:
         assert room.capacity == 25
         assert room.floor == 4
         
-    def test_update_room_as_regular_user(self, api_client, room, user):
+    def test_update_room_as_regular_user(self, user_client, room):
         """Test updating a room as a regular (non-admin) user."""
-        # Authenticate as regular user
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('room-detail', kwargs={'pk': room.id})
         data = {
             'name': 'User Updated Room',
             'capacity': 30,
             'floor': 5
         }
         
-        response = api_client.put(url, data, format='json')
+        response = user_client.put(room_detail_url(room.id), data, format='json')
         
         # Should return 403 Forbidden
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -137,16 +121,12 @@ class TestRoomViewSet:
         room.refresh_from_db()
         assert room.name != 'User Updated Room'
         
-    def test_delete_room_as_admin(self, api_client, admin_user):
+    def test_delete_room_as_admin(self, admin_client):
         """Test deleting a room as admin user."""
         # Create a room to delete
         room = Room.objects.create(name='Room To Delete', capacity=5, floor=1)
         
-        # Authenticate as admin
-        api_client.force_authenticate(user=admin_user)
-        
-        url = reverse('room-detail', kwargs={'pk': room.id})
-        response = api_client.delete(url)
+        response = admin_client.delete(room_detail_url(room.id))
         
         # Check response
         assert response.status_code == status.HTTP_204_NO_CONTENT
@@ -154,13 +134,9 @@ class TestRoomViewSet:
         # Check the room was deleted
         assert not Room.objects.filter(id=room.id).exists()
         
-    def test_delete_room_as_regular_user(self, api_client, room, user):
+    def test_delete_room_as_regular_user(self, user_client, room):
         """Test deleting a room as a regular (non-admin) user."""
-        # Authenticate as regular user
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('room-detail', kwargs={'pk': room.id})
-        response = api_client.delete(url)
+        response = user_client.delete(room_detail_url(room.id))
         
         # Should return 403 Forbidden
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -168,19 +144,17 @@ class TestRoomViewSet:
         # Room should not be deleted
         assert Room.objects.filter(id=room.id).exists()
         
-    def test_filter_rooms_by_capacity(self, api_client, user):
+    def test_filter_rooms_by_capacity(self, user_client):
         """Test filtering rooms by capacity."""
         # Create rooms with different capacities
-        Room.objects.create(name='Small Room', capacity=5, floor=1)
-        Room.objects.create(name='Medium Room', capacity=10, floor=1)
-        Room.objects.create(name='Large Room', capacity=20, floor=1)
-        
-        # Authenticate user
-        api_client.force_authenticate(user=user)
+        Room.objects.bulk_create([
+            Room(name='Small Room', capacity=5, floor=1),
+            Room(name='Medium Room', capacity=10, floor=1),
+            Room(name='Large Room', capacity=20, floor=1),
+        ])
         
         # Filter rooms with capacity >= 10
-        url = reverse('room-list')
-        response = api_client.get(url, {'capacity': 10})
+        response = user_client.get(ROOM_LIST_URL, {'capacity': 10})
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -188,62 +162,114 @@ class TestRoomViewSet:
         # Should include only medium and large rooms
         rooms = response.data['results']
         assert len(rooms) == 2
-        room_names = [room['name'] for room in rooms]
+        room_names = {room['name'] for room in rooms}
         assert 'Small Room' not in room_names
         assert 'Medium Room' in room_names
         assert 'Large Room' in room_names
         
-    def test_filter_rooms_by_floor(self, api_client, user):
+    def test_filter_rooms_by_floor(self, user_client):
         """Test filtering rooms by floor."""
         # Create rooms on different floors
-        Room.objects.create(name='First Floor Room', capacity=10, floor=1)
-        Room.objects.create(name='Second Floor Room', capacity=10, floor=2)
-        Room.objects.create(name='Third Floor Room', capacity=10, floor=3)
-        
-        # Authenticate user
-        api_client.force_authenticate(user=user)
+        Room.objects.bulk_create([
+            Room(name='First Floor Room', capacity=10, floor=1),
+            Room(name='Second Floor Room', capacity=10, floor=2),
+            Room(name='Third Floor Room', capacity=10, floor=3),
+        ])
         
         # Filter rooms on floor 2
-        url = reverse('room-list')
-        response = api_client.get(url, {'floor': 2})
+        response = user_client.get(ROOM_LIST_URL, {'floor': 2})
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
         
         # Should include only rooms on floor 2
         rooms = response.data['results']
-        room_names = [room['name'] for room in rooms]
+        room_names = {room['name'] for room in rooms}
         assert 'First Floor Room' not in room_names
         assert 'Second Floor Room' in room_names
         assert 'Third Floor Room' not in room_names
         
-    def test_filter_rooms_by_availability(self, api_client, room, user, booking):
+    def test_filter_rooms_by_floor_and_capacity(self, user_client):
+        """Test combining the floor and capacity filters."""
+        Room.objects.bulk_create([
+            Room(name='Small Second Floor Room', capacity=5, floor=2),
+            Room(name='Large Second Floor Room', capacity=20, floor=2),
+            Room(name='Large Third Floor Room', capacity=20, floor=3),
+        ])
+        
+        response = user_client.get(ROOM_LIST_URL, {'floor': 2, 'capacity': 10})
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        room_names = [room['name'] for room in response.data['results']]
+        assert room_names == ['Large Second Floor Room']
+        
+    def test_filter_rooms_by_availability(self, user_client, room, booking, today):
         """Test filtering rooms by availability."""
         # Create additional rooms
-        Room.objects.create(name='Available Room 1', capacity=10, floor=1)
-        Room.objects.create(name='Available Room 2', capacity=15, floor=2)
+        Room.objects.bulk_create([
+            Room(name='Available Room 1', capacity=10, floor=1),
+            Room(name='Available Room 2', capacity=15, floor=2),
+        ])
         
         # room fixture has a booking from 10:00 to 11:00 today
-        today = timezone.now().date()
-        
-        # Authenticate user
-        api_client.force_authenticate(user=user)
         
         # Filter rooms available from 10:00 to 11:00 today (when room fixture is booked)
-        url = reverse('room-list')
-        params = {
-            'date': str(today),
-            'start_time': '10:00:00',
-            'end_time': '11:00:00'
-        }
+        params = {'date': str(today), **BOOKED_SLOT}
         
-        response = api_client.get(url, params)
+        response = user_client.get(ROOM_LIST_URL, params)
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
         
         # Should include all rooms except the one with a booking
         rooms = response.data['results']
-        room_ids = [room['id'] for room in rooms]
+        room_ids = {room['id'] for room in rooms}
         assert room.id not in room_ids  # Booked room should not be included
-        assert len(rooms) >= 2  # Should include the available rooms 
\ No newline at end of file
+        assert len(rooms) >= 2  # Should include the available rooms
+        
+    def test_list_rooms_counts_full_first_page(self, user_client):
+        """Test a full first page still reports the total count."""
+        Room.objects.bulk_create(
+            Room(name=f'Room {number}', capacity=10, floor=1) for number in range(12)
+        )
+        
+        response = user_client.get(ROOM_LIST_URL)
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['count'] == 12
+        assert len(response.data['results']) == 10
+        assert response.data['next'] is not None
+        
+    def test_filter_rooms_by_availability_query_count(self, user_client, room, booking, django_assert_num_queries):
+        """Test availability filtering runs in the list query rather than per room."""
+        Room.objects.bulk_create(
+            Room(name=f'Free Room {number}', capacity=10, floor=1) for number in range(5)
+        )
+        
+        with django_assert_num_queries(1):
+            response = user_client.get(ROOM_LIST_URL, {'date': str(booking.date), **BOOKED_SLOT})
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        room_ids = [item['id'] for item in response.data['results']]
+        assert room.id not in room_ids
+        assert len(room_ids) == 5
+        
+    def test_filter_rooms_by_invalid_date(self, user_client):
+        """Test a malformed availability date is rejected on repeated requests."""
+        
+        # The cached filter form must still validate every request
+        for _ in range(2):
+            response = user_client.get(ROOM_LIST_URL, {'date': 'not-a-date'})
+            assert response.status_code == status.HTTP_400_BAD_REQUEST
+            assert 'date' in response.data
+        
+    def test_filter_rooms_by_invalid_floor(self, user_client):
+        """Test a malformed floor is rejected by the filter instead of erroring."""
+        response = user_client.get(ROOM_LIST_URL, {'floor': 'x'})
+        
+        # Check response
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'floor' in response.data
@@ -6,8 +6,10 @@ from .models import Room
 from .serializers import RoomSerializer, RoomDetailSerializer
 from .filters import RoomFilter
 from core.permissions import IsAdminUserOrReadOnly
-from django.db.models import QuerySet
-from typing import Type, Any
+from django.db.models import Exists, OuterRef, QuerySet
+from django.utils.dateparse import parse_date, parse_time
+from bookings.models import Booking
+from typing import Type, Any, Optional, Tuple
 
 
 class RoomViewSet(viewsets.ModelViewSet):
@@ -27,6 +29,8 @@ class RoomViewSet(viewsets.ModelViewSet):
     filterset_class = RoomFilter
     search_fields = ['name']
     ordering_fields = ['name', 'floor', 'capacity']
+    # The columns RoomSerializer renders; anything else stays deferred in lists
+    list_only_fields = RoomSerializer.Meta.fields
     
     def get_serializer_class(self) -> Type[RoomSerializer]:
         """
@@ -38,32 +42,42 @@ class RoomViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self) -> QuerySet:
         """
-        Optionally filter rooms by date, time, floor and capacity.
+        Annotate rooms with their availability for the requested slot.
+        
+        Floor, capacity and availability filtering is left to RoomFilter,
+        which validates the parameters and reuses this annotation.
         """
         queryset = Room.objects.all()
         
-        # Get query params
-        date = self.request.query_params.get('date')
-        start_time = self.request.query_params.get('start_time')
-        end_time = self.request.query_params.get('end_time')
-        floor = self.request.query_params.get('floor')
-        capacity = self.request.query_params.get('capacity')
+        # Resolve the clashes for the requested slot in the same query
+        slot = self.get_availability_slot()
+        if slot:
+            conflicts = Booking.objects.overlapping(*slot).filter(room=OuterRef('pk'))
+            queryset = queryset.annotate(slot_available=~Exists(conflicts))
         
-        # Filter by floor
-        if floor:
-            queryset = queryset.filter(floor=floor)
-            
-        # Filter by capacity
-        if capacity:
-            queryset = queryset.filter(capacity__gte=capacity)
-            
-        # Filter by availability
-        if all([date, start_time, end_time]):
-            available_rooms = []
-            for room in queryset:
-                if room.is_available(date, start_time, end_time):
-                    available_rooms.append(room.id)
-            
-            queryset = queryset.filter(id__in=available_rooms)
+        # Only load the columns the serializer renders when listing
+        if self.action == 'list':
+            queryset = queryset.only(*self.list_only_fields)
         
         return queryset
+        
+    def get_availability_slot(self) -> Optional[Tuple[Any, Any, Any]]:
+        """
+        Return the parsed (date, start_time, end_time) from the query params,
+        or None if any of them is missing or malformed.
+        """
+        params = self.request.query_params
+        date = params.get('date')
+        start_time = params.get('start_time')
+        end_time = params.get('end_time')
+        
+        # Most requests carry no slot, so skip parsing unless all three are given
+        if not (date and start_time and end_time):
+            return None
+        
+        try:
+            slot = (parse_date(date), parse_time(start_time), parse_time(end_time))
+        except ValueError:
+            return None
+        
+        return slot if all(slot) else None
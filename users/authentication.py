@@ -0,0 +1,53 @@
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+User = get_user_model()
+
+
+class ProfileJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that loads the user's profile in the user query.
+
+    Used by views that always render the profile, so the authenticated
+    user arrives with it instead of costing a second query.
+    """
+    # The columns those views render, plus is_active for the check below;
+    # anything else (such as the password hash) loads only when accessed
+    only_fields = (
+        'id', 'username', 'email', 'first_name', 'last_name', 'is_staff', 'is_active',
+        'profile__department', 'profile__phone_number',
+    )
+
+    def get_user(self, validated_token: Token) -> User:
+        """
+        Return the token's user, joined with its profile.
+
+        Mirrors JWTAuthentication.get_user apart from the narrowed, joined query.
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as exc:
+            raise InvalidToken(_('Token contained no recognizable user identification')) from exc
+
+        try:
+            user = self.user_model.objects.select_related('profile').only(*self.only_fields).get(
+                **{api_settings.USER_ID_FIELD: user_id}
+            )
+        except self.user_model.DoesNotExist as exc:
+            raise AuthenticationFailed(_('User not found'), code='user_not_found') from exc
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(
+                    _("The user's password has been changed."), code='password_changed'
+                )
+
+        return user
@@ -29,8 +29,3 @@ def create_user_profile(sender: Any, instance: User, created: bool, **kwargs: Di
     if created:
         UserProfile.objects.create(user=instance)
 
-
-@receiver(post_save, sender=User)
-def save_user_profile(sender: Any, instance: User, **kwargs: Dict[str, Any]) -> None:
-    """Save UserProfile when User is saved."""
-    instance.profile.save()
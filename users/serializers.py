@@ -1,6 +1,10 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
+from django.contrib.auth.validators import UnicodeUsernameValidator
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import Q
 from .models import UserProfile
 from typing import Dict, Any
 
@@ -41,18 +45,19 @@ class UserSerializer(serializers.ModelSerializer):
         """
         profile_data = validated_data.pop('profile', {})
         
-        # Update User fields
-        for attr, value in validated_data.items():
-            setattr(instance, attr, value)
-        
-        instance.save()
-        
-        # Update UserProfile fields
-        if profile_data:
-            for attr, value in profile_data.items():
-                setattr(instance.profile, attr, value)
+        with transaction.atomic():
+            # Update User fields, writing only the submitted columns
+            for attr, value in validated_data.items():
+                setattr(instance, attr, value)
             
-            instance.profile.save()
+            instance.save(update_fields=list(validated_data))
+            
+            # Update UserProfile fields
+            if profile_data:
+                for attr, value in profile_data.items():
+                    setattr(instance.profile, attr, value)
+                
+                instance.profile.save(update_fields=[*profile_data, 'updated_at'])
         
         return instance
 
@@ -61,8 +66,10 @@ class RegisterSerializer(serializers.ModelSerializer):
     """
     Serializer for user registration.
     """
+    # Uniqueness of email and username is checked together in validate()
     email = serializers.EmailField(required=True)
-    password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
+    # Validated in validate(), once the confirmation matches
+    password = serializers.CharField(write_only=True, required=True)
     password2 = serializers.CharField(write_only=True, required=True)
     profile = UserProfileSerializer(required=False)
     
@@ -72,6 +79,8 @@ class RegisterSerializer(serializers.ModelSerializer):
             'username', 'email', 'password', 'password2', 
             'first_name', 'last_name', 'profile'
         ]
+        # Replaces the generated UniqueValidator, which would query on its own
+        extra_kwargs = {'username': {'validators': [UnicodeUsernameValidator()]}}
     
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -89,11 +98,25 @@ class RegisterSerializer(serializers.ModelSerializer):
                 'password': 'Passwords do not match.'
             })
         
-        # Check if email is unique
-        if User.objects.filter(email=data['email']).exists():
-            raise serializers.ValidationError({
-                'email': 'A user with this email already exists.'
-            })
+        # Check the username and email are free in a single query
+        taken = User.objects.filter(
+            Q(username=data['username']) | Q(email=data['email'])
+        ).values_list('username', 'email')
+        
+        errors = {}
+        for username, email in taken:
+            if username == data['username']:
+                errors['username'] = 'A user with that username already exists.'
+            if email == data['email']:
+                errors['email'] = 'A user with this email already exists.'
+        if errors:
+            raise serializers.ValidationError(errors)
+        
+        # Run the password validators only on a confirmed password
+        try:
+            validate_password(data['password'])
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError({'password': list(exc.messages)})
         
         return data
     
@@ -111,15 +134,17 @@ class RegisterSerializer(serializers.ModelSerializer):
         validated_data.pop('password2')
         profile_data = validated_data.pop('profile', {})
         
-        # Create user
-        user = User.objects.create_user(**validated_data)
-        
-        # Update profile if data provided
-        if profile_data:
-            for attr, value in profile_data.items():
-                setattr(user.profile, attr, value)
+        # Commit the user and its profile together, so a failed profile
+        # write cannot leave a half-registered account behind
+        with transaction.atomic():
+            user = User.objects.create_user(**validated_data)
             
-            user.profile.save()
+            # Update the profile inserted by the post_save signal
+            if profile_data:
+                for attr, value in profile_data.items():
+                    setattr(user.profile, attr, value)
+                
+                user.profile.save(update_fields=[*profile_data, 'updated_at'])
         
         return user
 
@@ -132,6 +157,22 @@ class ChangePasswordSerializer(serializers.Serializer):
     new_password = serializers.CharField(required=True, validators=[validate_password])
     new_password2 = serializers.CharField(required=True)
     
+    def validate_old_password(self, value: str) -> str:
+        """
+        Check the old password against the user being updated, or the
+        requesting user when no instance is given.
+        
+        Args:
+            value: Old password to check
+            
+        Returns:
+            str: The old password
+        """
+        user = self.instance if self.instance is not None else self.context['request'].user
+        if not user.check_password(value):
+            raise serializers.ValidationError('Wrong password.')
+        return value
+    
     def validate(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate password change data.
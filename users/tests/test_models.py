@@ -68,4 +68,22 @@ class TestUserProfileModel:
         
         # Try to create another profile for the same user
         with pytest.raises(IntegrityError):
-            UserProfile.objects.create(user=user) 
\ No newline at end of file
+            UserProfile.objects.create(user=user)
+        
+    def test_user_save_skips_unloaded_profile(self, user, django_assert_num_queries):
+        """Test saving a user does not load or rewrite a profile it never touched."""
+        user = User.objects.get(pk=user.pk)
+        user.first_name = "Renamed"
+        
+        # Only the user UPDATE runs
+        with django_assert_num_queries(1):
+            user.save()
+        
+    def test_user_save_does_not_write_profile(self, user, django_assert_num_queries):
+        """Test saving a user never writes its profile, even once loaded."""
+        user.profile.department = "Sales"
+        
+        with django_assert_num_queries(1):
+            user.save()
+        
+        assert UserProfile.objects.get(user=user).department == ""
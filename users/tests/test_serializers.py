@@ -51,6 +51,23 @@ class TestUserSerializer:
         # Check profile data was updated
         assert updated_user.profile.department == 'IT'
         assert updated_user.profile.phone_number == '+9876543210'
+        
+    def test_user_update_writes_only_changed_columns(self, user, django_assert_num_queries):
+        """Test an update saves the user and profile once each, narrowed to the submitted columns."""
+        user.profile  # Load the profile so the post_save signal could re-save it
+        serializer = UserSerializer(user, partial=True)
+        
+        with django_assert_num_queries(4) as captured:  # SAVEPOINT, two UPDATEs, RELEASE
+            serializer.update(user, {'first_name': 'Updated', 'profile': {'department': 'IT'}})
+        
+        updates = [q['sql'] for q in captured.captured_queries if q['sql'].startswith('UPDATE')]
+        assert len(updates) == 2
+        assert '"first_name"' in updates[0] and '"email"' not in updates[0]
+        assert '"department"' in updates[1] and '"phone_number"' not in updates[1]
+        
+        user.refresh_from_db()
+        assert user.first_name == 'Updated'
+        assert user.profile.department == 'IT'
 
 
 @pytest.mark.django_db
@@ -96,6 +113,32 @@ class TestRegisterSerializer:
         assert not serializer.is_valid()
         assert 'password' in serializer.errors
         
+    def test_weak_password(self):
+        """Test registration with a confirmed but common password."""
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'password',
+            'password2': 'password'
+        }
+        
+        serializer = RegisterSerializer(data=data)
+        assert not serializer.is_valid()
+        assert 'password' in serializer.errors
+        
+    def test_password_mismatch_skips_password_validators(self):
+        """Test a mismatched confirmation is reported without validating the password."""
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'password',
+            'password2': 'different'
+        }
+        
+        serializer = RegisterSerializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors['password'] == ['Passwords do not match.']
+        
     def test_duplicate_email(self):
         """Test registration with an email that already exists."""
         # Create a user with the email
@@ -118,13 +161,40 @@ class TestRegisterSerializer:
         serializer = RegisterSerializer(data=data)
         assert not serializer.is_valid()
         assert 'email' in serializer.errors
-
+        
+    def test_duplicate_username(self, user):
+        """Test registration with a username that already exists."""
+        data = {
+            'username': user.username,
+            'email': 'new@example.com',
+            'password': 'ComplexPass123!',
+            'password2': 'ComplexPass123!'
+        }
+        
+        serializer = RegisterSerializer(data=data)
+        assert not serializer.is_valid()
+        assert serializer.errors['username'] == ['A user with that username already exists.']
+        assert 'email' not in serializer.errors
+        
+    def test_uniqueness_checked_in_one_query(self, user, django_assert_num_queries):
+        """Test username and email clashes are both found by a single query."""
+        data = {
+            'username': user.username,
+            'email': user.email,
+            'password': 'ComplexPass123!',
+            'password2': 'ComplexPass123!'
+        }
+        
+        serializer = RegisterSerializer(data=data)
+        with django_assert_num_queries(1):
+            assert not serializer.is_valid()
+        assert set(serializer.errors) == {'username', 'email'}
 
 @pytest.mark.django_db
 class TestChangePasswordSerializer:
     """Test suite for ChangePasswordSerializer."""
 
-    def test_valid_password_change(self, user):
+    def test_valid_password_change(self, drf_request):
         """Test valid password change."""
         data = {
             'old_password': 'testpassword',  # From the user fixture
@@ -132,10 +202,10 @@ class TestChangePasswordSerializer:
             'new_password2': 'NewComplex123!'
         }
         
-        serializer = ChangePasswordSerializer(data=data)
+        serializer = ChangePasswordSerializer(data=data, context={'request': drf_request})
         assert serializer.is_valid()
         
-    def test_password_mismatch(self):
+    def test_password_mismatch(self, drf_request):
         """Test password change with mismatched new passwords."""
         data = {
             'old_password': 'testpassword',
@@ -143,6 +213,18 @@ class TestChangePasswordSerializer:
             'new_password2': 'Different123!'
         }
         
-        serializer = ChangePasswordSerializer(data=data)
+        serializer = ChangePasswordSerializer(data=data, context={'request': drf_request})
+        assert not serializer.is_valid()
+        assert 'new_password' in serializer.errors 
+        
+    def test_wrong_old_password(self, drf_request):
+        """Test password change with an old password that does not match."""
+        data = {
+            'old_password': 'wrongpassword',
+            'new_password': 'NewComplex123!',
+            'new_password2': 'NewComplex123!'
+        }
+        
+        serializer = ChangePasswordSerializer(data=data, context={'request': drf_request})
         assert not serializer.is_valid()
-        assert 'new_password' in serializer.errors 
\ No newline at end of file
+        assert serializer.errors['old_password'] == ['Wrong password.']
@@ -1,22 +1,25 @@
 import pytest
-from django.urls import reverse
+from django.urls import reverse_lazy
 from django.contrib.auth.models import User
 from rest_framework import status
 from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+PROFILE_URL = reverse_lazy('user-profile')
+REGISTER_URL = reverse_lazy('register')
+CHANGE_PASSWORD_URL = reverse_lazy('change-password')
+TOKEN_OBTAIN_URL = reverse_lazy('token_obtain_pair')
+TOKEN_REFRESH_URL = reverse_lazy('token_refresh')
 
 
 @pytest.mark.django_db
 class TestUserProfileView:
     """Test suite for UserProfileView API endpoint."""
 
-    def test_get_profile_authenticated(self, api_client, user):
+    def test_get_profile_authenticated(self, user_client, user):
         """Test retrieving user profile when authenticated."""
-        # Authenticate the user
-        api_client.force_authenticate(user=user)
-        
         # Get the profile
-        url = reverse('user-profile')
-        response = api_client.get(url)
+        response = user_client.get(PROFILE_URL)
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -25,19 +28,45 @@ class TestUserProfileView:
         assert response.data['email'] == user.email
         assert 'profile' in response.data
         
+    def test_get_profile_loads_profile_with_user(self, api_client, user, django_assert_num_queries):
+        """Test a token-authenticated profile GET fetches the user and profile in one query."""
+        token = AccessToken.for_user(user)
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        
+        with django_assert_num_queries(1):
+            response = api_client.get(PROFILE_URL)
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['profile']['department'] == user.profile.department
+        
+    def test_update_profile_with_token(self, api_client, user):
+        """Test a token-authenticated PATCH saves the narrowly loaded user and profile."""
+        token = AccessToken.for_user(user)
+        api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {token}')
+        
+        data = {'first_name': 'Token', 'profile': {'department': 'Research'}}
+        response = api_client.patch(PROFILE_URL, data, format='json')
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['is_staff'] is False
+        
+        # Unrelated columns are left intact
+        user.refresh_from_db()
+        assert user.first_name == 'Token'
+        assert user.profile.department == 'Research'
+        assert user.check_password('testpassword')
+        
     def test_get_profile_unauthenticated(self, api_client):
         """Test that unauthenticated users cannot access profile."""
-        url = reverse('user-profile')
-        response = api_client.get(url)
+        response = api_client.get(PROFILE_URL)
         
         # Should return 401 Unauthorized
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         
-    def test_update_profile(self, api_client, user):
+    def test_update_profile(self, user_client, user):
         """Test updating user profile."""
-        # Authenticate the user
-        api_client.force_authenticate(user=user)
-        
         # Update data
         data = {
             'first_name': 'Updated',
@@ -49,8 +78,7 @@ class TestUserProfileView:
         }
         
         # Update the profile
-        url = reverse('user-profile')
-        response = api_client.patch(url, data, format='json')
+        response = user_client.patch(PROFILE_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -71,7 +99,6 @@ class TestRegisterView:
 
     def test_register_user(self, api_client):
         """Test registering a new user."""
-        url = reverse('register')
         data = {
             'username': 'newuser',
             'email': 'new@example.com',
@@ -85,7 +112,7 @@ class TestRegisterView:
             }
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(REGISTER_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_201_CREATED
@@ -97,9 +124,27 @@ class TestRegisterView:
         assert user.first_name == 'New'
         assert user.profile.department == 'Marketing'
         
+    def test_register_user_query_count(self, api_client, django_assert_num_queries):
+        """Test registration runs a fixed number of queries, including the response."""
+        data = {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password': 'ComplexPass123!',
+            'password2': 'ComplexPass123!',
+            'profile': {'department': 'Marketing'}
+        }
+        
+        # Username and email check, then SAVEPOINT, user and profile INSERTs,
+        # profile UPDATE, RELEASE
+        with django_assert_num_queries(6):
+            response = api_client.post(REGISTER_URL, data, format='json')
+        
+        # Check response
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['profile']['department'] == 'Marketing'
+        
     def test_register_with_invalid_data(self, api_client):
         """Test registration with invalid data."""
-        url = reverse('register')
         
         # Missing required fields
         data = {
@@ -107,7 +152,7 @@ class TestRegisterView:
             # Missing password fields
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(REGISTER_URL, data, format='json')
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         
         # Password mismatch
@@ -118,7 +163,7 @@ class TestRegisterView:
             'password2': 'Different123!'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(REGISTER_URL, data, format='json')
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'password' in response.data
 
@@ -127,19 +172,15 @@ class TestRegisterView:
 class TestChangePasswordView:
     """Test suite for ChangePasswordView API endpoint."""
 
-    def test_change_password_success(self, api_client, user):
+    def test_change_password_success(self, user_client, user):
         """Test successfully changing a password."""
-        # Authenticate the user
-        api_client.force_authenticate(user=user)
-        
-        url = reverse('change-password')
         data = {
             'old_password': 'testpassword',  # From user fixture
             'new_password': 'NewSecure123!',
             'new_password2': 'NewSecure123!'
         }
         
-        response = api_client.put(url, data, format='json')
+        response = user_client.put(CHANGE_PASSWORD_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -149,19 +190,34 @@ class TestChangePasswordView:
         user.refresh_from_db()
         assert user.check_password('NewSecure123!')
         
-    def test_change_password_wrong_old_password(self, api_client, user):
-        """Test that providing wrong old password fails."""
-        # Authenticate the user
-        api_client.force_authenticate(user=user)
+    def test_change_password_locks_and_updates_only_password(self, user_client, django_assert_num_queries):
+        """Test a password change locks the user row and writes only the password column."""
+        data = {
+            'old_password': 'testpassword',
+            'new_password': 'NewSecure123!',
+            'new_password2': 'NewSecure123!'
+        }
         
-        url = reverse('change-password')
+        # SAVEPOINT, locking SELECT, UPDATE, RELEASE
+        with django_assert_num_queries(4) as captured:
+            response = user_client.put(CHANGE_PASSWORD_URL, data, format='json')
+        
+        # Check response
+        assert response.status_code == status.HTTP_200_OK
+        select, update = (q['sql'] for q in captured.captured_queries[1:3])
+        assert select.startswith('SELECT') and select.endswith('FOR UPDATE')
+        assert update.startswith('UPDATE') and '"password"' in update
+        assert '"username"' not in update and '"email"' not in update
+        
+    def test_change_password_wrong_old_password(self, user_client, user):
+        """Test that providing wrong old password fails."""
         data = {
             'old_password': 'wrongpassword',
             'new_password': 'NewSecure123!',
             'new_password2': 'NewSecure123!'
         }
         
-        response = api_client.put(url, data, format='json')
+        response = user_client.put(CHANGE_PASSWORD_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -174,14 +230,13 @@ class TestChangePasswordView:
         
     def test_change_password_unauthenticated(self, api_client):
         """Test that unauthenticated users cannot change password."""
-        url = reverse('change-password')
         data = {
             'old_password': 'testpassword',
             'new_password': 'NewSecure123!',
             'new_password2': 'NewSecure123!'
         }
         
-        response = api_client.put(url, data, format='json')
+        response = api_client.put(CHANGE_PASSWORD_URL, data, format='json')
         
         # Should return 401 Unauthorized
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -193,13 +248,12 @@ class TestJWTAuthentication:
 
     def test_obtain_token(self, api_client, user):
         """Test obtaining a JWT token."""
-        url = reverse('token_obtain_pair')
         data = {
             'username': 'testuser',  # From user fixture
             'password': 'testpassword'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(TOKEN_OBTAIN_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -211,22 +265,20 @@ class TestJWTAuthentication:
     def test_refresh_token(self, api_client, user):
         """Test refreshing a JWT token."""
         # First, obtain a token
-        obtain_url = reverse('token_obtain_pair')
         data = {
             'username': 'testuser',
             'password': 'testpassword'
         }
         
-        response = api_client.post(obtain_url, data, format='json')
+        response = api_client.post(TOKEN_OBTAIN_URL, data, format='json')
         refresh_token = response.data['refresh']
         
         # Now try to refresh the token
-        refresh_url = reverse('token_refresh')
         data = {
             'refresh': refresh_token
         }
         
-        response = api_client.post(refresh_url, data, format='json')
+        response = api_client.post(TOKEN_REFRESH_URL, data, format='json')
         
         # Check response
         assert response.status_code == status.HTTP_200_OK
@@ -234,13 +286,12 @@ class TestJWTAuthentication:
         
     def test_invalid_credentials(self, api_client):
         """Test that invalid credentials don't get a token."""
-        url = reverse('token_obtain_pair')
         data = {
             'username': 'nonexistent',
             'password': 'wrongpass'
         }
         
-        response = api_client.post(url, data, format='json')
+        response = api_client.post(TOKEN_OBTAIN_URL, data, format='json')
         
         # Check response - should be unauthorized
         assert response.status_code == status.HTTP_401_UNAUTHORIZED 
\ No newline at end of file
@@ -5,7 +5,8 @@ from rest_framework.views import APIView
 from rest_framework_simplejwt.views import TokenObtainPairView
 from rest_framework.permissions import IsAuthenticated, AllowAny
 from django.contrib.auth import get_user_model
-from django.contrib.auth.models import User
+from django.db import transaction
+from .authentication import ProfileJWTAuthentication
 from .serializers import (
     UserSerializer, 
     RegisterSerializer, 
@@ -21,6 +22,8 @@ class UserProfileView(generics.RetrieveUpdateAPIView):
     API endpoint for authenticated users to view and update their profile.
     """
     serializer_class = UserSerializer
+    # Authenticate with the profile joined, since every response renders it
+    authentication_classes = [ProfileJWTAuthentication]
     permission_classes = [IsAuthenticated]
     
     def get_object(self) -> User:
@@ -34,7 +37,7 @@ class RegisterView(generics.CreateAPIView):
     """
     API endpoint for user registration.
     """
-    queryset = User.objects.all()
+    queryset = User.objects.select_related('profile')
     permission_classes = [AllowAny]
     serializer_class = RegisterSerializer
 
@@ -48,27 +51,24 @@ class ChangePasswordView(generics.UpdateAPIView):
     
     def get_object(self) -> User:
         """
-        Return the authenticated user.
+        Return the authenticated user's password row, locked until the
+        surrounding transaction ends.
         """
-        return self.request.user
+        return User.objects.select_for_update().only('id', 'password').get(pk=self.request.user.pk)
         
     def update(self, request: Any, *args: Any, **kwargs: Any) -> Response:
         """
         Update the user's password.
         """
-        user = self.get_object()
-        serializer = self.get_serializer(data=request.data)
-        
-        if serializer.is_valid():
-            # Check old password
-            old_password = serializer.validated_data.get('old_password')
-            if not user.check_password(old_password):
-                return Response({'old_password': ['Wrong password.']}, status=status.HTTP_400_BAD_REQUEST)
-                
-            # Set new password
-            user.set_password(serializer.validated_data.get('new_password'))
-            user.save()
+        # Hold the row lock from the old password check to the write, so
+        # concurrent changes cannot both pass against the same old password
+        with transaction.atomic():
+            user = self.get_object()
+            serializer = self.get_serializer(user, data=request.data)
+            serializer.is_valid(raise_exception=True)
             
-            return Response({'message': 'Password updated successfully.'}, status=status.HTTP_200_OK)
-            
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+            # Set new password, writing only the password column
+            user.set_password(serializer.validated_data['new_password'])
+            user.save(update_fields=['password'])
+        
+        return Response({'message': 'Password updated successfully.'}, status=status.HTTP_200_OK)